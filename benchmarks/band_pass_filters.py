@@ -0,0 +1,40 @@
+'''Compares the time taken to compute the Baxter-King and Christiano-Fitzgerald filters of many
+series with statsmodels one series at a time and with panel.bp_filter() and panel.cf_filter().
+
+Usage:
+
+    python benchmarks/band_pass_filters.py [--series N] [--observations N]
+'''
+
+import argparse
+
+import numpy as np
+
+from common import best, quarterly
+import fredpy
+
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--series',type=int,default=1000)
+    parser.add_argument('--observations',type=int,default=300)
+    args = parser.parse_args()
+
+    import statsmodels.api as sm
+
+    series = quarterly(args.series,args.observations)
+    panel = fredpy.panel(series)
+
+    bk = panel.bp_filter()[0]
+    cf = panel.cf_filter()[0]
+
+    for key,s in list(series.items())[:10]:
+        assert np.allclose(bk.data[key].to_numpy(),sm.tsa.filters.bkfilter(s.data,low=6,high=32,K=12).to_numpy())
+        assert np.allclose(cf.data[key].to_numpy(),sm.tsa.filters.cffilter(s.data,low=6,high=32,drift=False)[0].to_numpy())
+
+    print('{} series with {} observations'.format(args.series,args.observations))
+    print('  statsmodels bkfilter:          {:8.2f} ms'.format(best(lambda: [sm.tsa.filters.bkfilter(s.data,low=6,high=32,K=12) for s in series.values()])))
+    print('  panel.bp_filter():             {:8.2f} ms'.format(best(lambda: panel.bp_filter())))
+    print('  statsmodels cffilter:          {:8.2f} ms'.format(best(lambda: [sm.tsa.filters.cffilter(s.data,low=6,high=32,drift=False) for s in series.values()])))
+    print('  panel.cf_filter():             {:8.2f} ms'.format(best(lambda: panel.cf_filter())))
@@ -0,0 +1,39 @@
+'''Helpers shared by the benchmarks. Importing this module puts the repository root first on
+sys.path, so the benchmarks time the fredpy in this checkout.
+'''
+
+import os
+import sys
+import timeit
+
+import numpy as np
+
+sys.path.insert(0,os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import fredpy
+
+
+def best(statement,number=1,repeat=3):
+
+    # Returns the best time of repeat runs of statement in milliseconds per call.
+
+    return min(timeit.repeat(statement,number=number,repeat=repeat))/number*1000
+
+
+def daily(n,start,seed):
+
+    # Returns a daily series with n observations on business days from start.
+
+    dates = np.busday_offset(start,np.arange(n),roll='forward').astype(str)
+
+    return fredpy.to_fred_series(np.random.default_rng(seed).standard_normal(n).cumsum(),dates,frequency_short='D',
+                                 series_id='S{}'.format(seed),title='Series {}'.format(seed),units='Percent',units_short='%')
+
+
+def quarterly(k,n):
+
+    # Returns a dict of k quarterly series with n observations each.
+
+    dates = np.arange(np.datetime64('1947-01'),np.datetime64('1947-01')+3*n,3).astype('datetime64[D]').astype(str)
+    rng = np.random.default_rng(0)
+
+    return {'S{:04d}'.format(i):fredpy.to_fred_series(rng.standard_normal(n).cumsum(),dates,frequency='Quarterly',series_id='S{:04d}'.format(i)) for i in range(k)}
@@ -0,0 +1,66 @@
+'''Measures the time taken by "import fredpy" with python -X importtime and fails if a slow optional
+dependency is imported eagerly or the import takes longer than a threshold.
+
+Usage:
+
+    python benchmarks/import_time.py [--repeat N] [--max-seconds S]
+'''
+
+import argparse
+import os
+import subprocess
+import sys
+
+# Modules that fredpy must not import until they are needed
+deferred = ['matplotlib','statsmodels','scipy','aiohttp']
+
+
+def import_time():
+
+    # Returns the cumulative import time of fredpy in seconds and the set of top-level modules
+    # imported, parsed from the -X importtime report.
+
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    result = subprocess.run([sys.executable,'-X','importtime','-c','import fredpy'],
+                            cwd=root,capture_output=True,text=True,check=True)
+
+    total = None
+    modules = set()
+
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        fields = [field.strip() for field in line[len('import time:'):].split('|')]
+        modules.add(fields[2].split('.')[0])
+        if fields[2] == 'fredpy':
+            total = int(fields[1])/1e6
+
+    return total, modules
+
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat',type=int,default=5)
+    parser.add_argument('--max-seconds',type=float,default=None)
+    args = parser.parse_args()
+
+    times = []
+    for k in range(args.repeat):
+        total, modules = import_time()
+        times.append(total)
+
+    print('import fredpy: best {:.3f} s, median {:.3f} s over {} runs'.format(min(times),sorted(times)[len(times)//2],len(times)))
+
+    failed = False
+
+    for module in deferred:
+        if module in modules:
+            print('FAIL: {} is imported by "import fredpy"'.format(module))
+            failed = True
+
+    if args.max_seconds is not None and min(times) > args.max_seconds:
+        print('FAIL: import took longer than {:.3f} s'.format(args.max_seconds))
+        failed = True
+
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,64 @@
+'''Compares the time taken to convert the JSON response of a fred/series/observations query into
+a Pandas Series by fredpy's array-based parser and by the DataFrame-based conversion it replaced.
+
+Usage:
+
+    python benchmarks/parse_observations.py [--observations N]
+'''
+
+import argparse
+import json
+
+import numpy as np
+import pandas as pd
+
+from common import best
+import fredpy
+
+
+def parse_dataframe(results):
+
+    # Conversion used before fredpy._parse_observations
+
+    data = pd.DataFrame(results['observations'],columns =['date','value'])
+    data = data.replace('.', np.nan)
+    data['date'] = pd.to_datetime(data['date'])
+
+    return data.set_index('date')['value'].astype(float)
+
+
+def response(n):
+
+    # Returns the body of a response with n daily observations, about 2% of them missing.
+
+    dates = np.datetime_as_string(np.arange(np.datetime64('1962-01-02'),np.datetime64('1962-01-02')+n))
+    values = ['.' if k%50 == 0 else '{:.2f}'.format(4+np.sin(k/500)) for k in range(n)]
+    observations = [{'realtime_start':'2021-04-09','realtime_end':'2021-04-09','date':d,'value':v} for d,v in zip(dates,values)]
+
+    return json.dumps({'count':n,'observations':observations}).encode()
+
+
+def parse_arrays(results):
+
+    return fredpy._parse_observations(fredpy._observation_arrays(results['observations']))
+
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--observations',type=int,default=20000)
+    args = parser.parse_args()
+
+    content = response(args.observations)
+    results = json.loads(content)
+
+    assert parse_dataframe(results).equals(parse_arrays(results))
+
+    number = max(1,200000//args.observations)
+
+    print('{} observations'.format(args.observations))
+    print('  decode, json:                  {:8.2f} ms'.format(best(lambda: json.loads(content),number,repeat=5)))
+    if fredpy._loads is not json.loads:
+        print('  decode, orjson:                {:8.2f} ms'.format(best(lambda: fredpy._loads(content),number,repeat=5)))
+    print('  parse, DataFrame conversion:   {:8.2f} ms'.format(best(lambda: parse_dataframe(results),number,repeat=5)))
+    print('  parse, arrays:                 {:8.2f} ms'.format(best(lambda: parse_arrays(results),number,repeat=5)))
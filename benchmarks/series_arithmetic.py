@@ -0,0 +1,36 @@
+'''Compares the time taken by arithmetic with two long daily series: with the same dates, and with
+different dates aligned by window_equalize() and plus() or by the + operator.
+
+Usage:
+
+    python benchmarks/series_arithmetic.py [--observations N]
+'''
+
+import argparse
+
+from common import best, daily
+import fredpy
+
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--observations',type=int,default=200000)
+    args = parser.parse_args()
+
+    n = args.observations
+
+    s1 = daily(n,'1800-01-01',1)
+    s2 = daily(n,'1800-01-01',2)
+    s3 = daily(n,'1801-01-01',3)
+
+    aligned = fredpy.window_equalize([s1,s3])
+    assert (s1+s3).data.equals(fredpy.plus(*aligned).data)
+
+    print('{} daily observations'.format(n))
+    print('  same dates:      pandas data + data:           {:8.2f} ms'.format(best(lambda: s1.data+s2.data,number=10)))
+    print('  same dates:      plus()                        {:8.2f} ms'.format(best(lambda: fredpy.plus(s1,s2),number=10)))
+    print('  same dates:      +                             {:8.2f} ms'.format(best(lambda: s1+s2,number=10)))
+    print('  different dates: window_equalize() and plus()  {:8.2f} ms'.format(best(lambda: fredpy.plus(*fredpy.window_equalize([s1,s3])),number=10)))
+    print('  different dates: +                             {:8.2f} ms'.format(best(lambda: s1+s3,number=10)))
+    print('  different dates: plus(join=\'outer\')            {:8.2f} ms'.format(best(lambda: fredpy.plus(s1,s3,join='outer'),number=10)))
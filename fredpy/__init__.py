@@ -2,21 +2,93 @@ import requests
 import dateutil
 import datetime
 import os
-import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 import warnings
-import statsmodels.api as sm
 import time
-tsa = sm.tsa
+import sqlite3
+import zlib
+import json
+import contextlib
+import threading
+import concurrent.futures
+import logging
+import random
+import re
+import operator
+import weakref
+import collections
+import functools
+import hashlib
+import inspect
+import pickle
 
-# Read recession data data
-cycle_data = pd.read_csv('https://raw.githubusercontent.com/letsgoexploring/fredpy-package/gh-pages/business%20cycle%20dates/business_cycle_dates.csv')
-if pd.isna(cycle_data.troughs.iloc[-1]):
-    cycle_data.troughs.iloc[-1] = pd.to_datetime('today').strftime('%Y-%m-%d')
-    
-cycle_data['peaks'] = pd.to_datetime(cycle_data.peaks)
-cycle_data['troughs'] = pd.to_datetime(cycle_data.troughs)
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+# Use the faster orjson package to decode long API responses when it is installed
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+logger = logging.getLogger(__name__)
+
+# Recession data. fredpy.cycle_data is read from the copy of business_cycle_dates.csv included in
+# the package when it is first used. Use refresh_cycle_data() to download the latest dates.
+cycle_data_url = 'https://raw.githubusercontent.com/letsgoexploring/fredpy-package/gh-pages/business%20cycle%20dates/business_cycle_dates.csv'
+
+def _read_cycle_data(path):
+
+    # Reads peak and trough dates. An ongoing recession has no trough and is assumed to end today.
+
+    cycle_data = pd.read_csv(path)
+    if pd.isna(cycle_data.troughs.iloc[-1]):
+        cycle_data.loc[cycle_data.index[-1],'troughs'] = pd.to_datetime('today').strftime('%Y-%m-%d')
+        
+    cycle_data['peaks'] = pd.to_datetime(cycle_data.peaks)
+    cycle_data['troughs'] = pd.to_datetime(cycle_data.troughs)
+
+    return cycle_data
+
+
+def _get_cycle_data():
+
+    # Returns fredpy.cycle_data, reading the included file on first use.
+
+    global cycle_data
+
+    try:
+        return cycle_data
+    except NameError:
+        cycle_data = _read_cycle_data(os.path.join(os.path.dirname(__file__),'business_cycle_dates.csv'))
+        return cycle_data
+
+
+def __getattr__(name):
+
+    # matplotlib and statsmodels are slow to import, so they are only imported by the methods that
+    # use them. fredpy.plt, fredpy.sm, and fredpy.tsa remain available for existing code.
+
+    if name == 'cycle_data':
+        return _get_cycle_data()
+
+    if name == 'plt':
+        import matplotlib.pyplot as plt
+        return plt
+
+    if name == 'sm':
+        import statsmodels.api as sm
+        return sm
+
+    if name == 'tsa':
+        import statsmodels.api as sm
+        return sm.tsa
+
+    raise AttributeError('module '+repr(__name__)+' has no attribute '+repr(name))
 
 # API key attribute needs to be set
 
@@ -53,801 +125,3486 @@ def load_api_key(path):
 
 
 ######################################################################################################
-# The series class and methods
+# Client for the FRED API
 
-class series:
+class api_client:
 
-    '''Defines a class for downloading, storing, and manipulating data from FRED.'''
+    '''Defines a class for sending queries to the FRED API. Queries are sent through a 
+    requests.Session that keeps connections to the API alive and reuses them. All functions in
+    fredpy query the API through fredpy.client, which can be replaced to change the connection
+    settings or to point fredpy at a different server:
 
-    def __init__(self,series_id=None,observation_date=None):
+        fredpy.client = fredpy.api_client(pool_size=20,timeout=60)
+    '''
 
-        '''Initializes an instance of the series class.
+    def __init__(self,base_url='https://api.stlouisfed.org/',pool_size=10,timeout=30,session=None):
+
+        '''Initializes an instance of the api_client class.
 
         Args:
-            series_id (string):     unique FRED series ID. If series_id equals None, an empty series 
-                                        object is created.
-            realtime_end (string):  YYYY-MM-DD formatted state string. Indicates the final date at
-                                        which the series is observed. I.e., excludes revisions made
-                                        after realtime_end. If only YYYY string is provided, month 
-                                        and day are assumed to be December 31.
+            base_url (string):              root URL of the API. Default: 'https://api.stlouisfed.org/'
+            pool_size (int):                maximum number of connections kept open. Should be at
+                                                least the number of threads sending queries. Default: 10
+            timeout (int or float):         seconds to wait for the server to respond. Default: 30
+            session (requests.Session):     session used for the queries. Default: a new session.
 
         Returns:
             None
+        '''
 
-        Attributes:
-            data:                       (Pandas Series) data values with dates as index.
-            date_range:                 (string) specifies the dates of the first and last observations.
-            frequency:                  (string) data frequency. 'Daily', 'Weekly', 'Monthly', 'Quarterly', 'Semiannual', or 'Annual'.
-            frequency_short:            (string) data frequency. Abbreviated. 'D', 'W', 'M', 'Q', 'SA, or 'A'.
-            last_updated:               (string) date series was last updated.
-            notes:                      (string) details about series. Not available for all series.
-            observation_date:           (string) vintage date at which data are observed.
-            release:                    (string) statistical release containing data.
-            seasonal_adjustment:        (string) specifies whether the data has been seasonally adjusted.
-            seasonal_adjustment_short:  (string) specifies whether the data has been seasonally adjusted. Abbreviated.
-            series_id:                  (string) unique FRED series ID code.
-            source:                     (string) original source of the data.
-            t:                          (int) number corresponding to frequency: 365 for daily, 52 for weekly, 12 for monthly, 4 for quarterly, and 1 for annual.
-            title:                      (string) title of the data series.
-            units:                      (string) units of the data series.
-            units_short:                (string) units of the data series. Abbreviated.
+        if session is None:
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_connections=pool_size,pool_maxsize=pool_size)
+            session.mount('https://',adapter)
+            session.mount('http://',adapter)
+
+        session.headers.update({'Accept-Encoding':'gzip, deflate'})
+
+        self.base_url = base_url
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.session = session
+
+
+    def get(self,path,parameters,stream=False):
+
+        '''Sends a query to the API and returns the response without checking its status.
+
+        Args:
+            path (string):      API path.
+            parameters (dict):  query parameters, including api_key.
+            stream (bool):      If True, the body of the response is not read until it is accessed.
+                                    Default: False
+
+        Returns:
+            requests.models.Response
         '''
 
-        if api_key is None:
-            raise ValueError('fredpy.api_key value not assigned. You need to provide your key for the FRED API.')
+        return self.session.get(self.base_url+path,params=parameters,timeout=self.timeout,stream=stream)
 
-        if observation_date is None:
 
-            observation_date = datetime.datetime.today().strftime('%Y-%m-%d')
+# Client used for all queries to the FRED API
+client = api_client()
 
-        if len(observation_date) == 4:
 
-            observation_date = observation_date+'-12-31'
+######################################################################################################
+# Cache for FRED API responses
 
-        if type(series_id) == str:
+class _sqlite_store:
 
+    # Stores compressed values by key in a table of a SQLite database on disk. Used by
+    # request_cache and result_cache. Values can expire at a given time, and when the stored values
+    # exceed a maximum size, the least recently used values are evicted. Connections are opened for
+    # each operation so that the database can be shared by threads and processes.
 
-            path = 'fred/series'
+    def __init__(self,path,table):
 
-            parameters = {'series_id':series_id,
-              'realtime_start':observation_date,
-              'realtime_end':observation_date,
-              'file_type':'json'
-             }
+        self.path = path
+        self.table = table
 
-            r = fred_api_request(api_key=api_key,path=path,parameters=parameters)
-            results = r.json()
-
-            self.series_id = series_id
-            self.title = results['seriess'][0]['title']
-            self.frequency = results['seriess'][0]['frequency']
-            self.frequency_short = results['seriess'][0]['frequency_short']
-            self.observation_date = datetime.datetime.strptime(observation_date,"%Y-%m-%d").strftime('%B %d, %Y')
-            self.units = results['seriess'][0]['units']
-            self.units_short = results['seriess'][0]['units_short']
-            self.seasonal_adjustment = results['seriess'][0]['seasonal_adjustment']
-            self.seasonal_adjustment_short = results['seriess'][0]['seasonal_adjustment_short']
-            self.last_updated = results['seriess'][0]['last_updated']
-            
-            try:
-                self.notes = results['seriess'][0]['notes']
-            except:
-                self.notes = ''
+        with self._connect() as connection, connection:
+            connection.execute('''CREATE TABLE IF NOT EXISTS {0} (
+                key TEXT PRIMARY KEY,
+                content BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                accessed REAL NOT NULL,
+                expires REAL)'''.format(table))
+            connection.execute('CREATE INDEX IF NOT EXISTS {0}_accessed ON {0} (accessed)'.format(table))
 
-            obs_per_year = {'D':365,'W':52,'M':12,'Q':4,'SA':2,'A':1}
-            try:
-                self.t = obs_per_year[self.frequency_short]
-            except:
-                self.t = np.nan
 
+    def _connect(self):
+        return contextlib.closing(sqlite3.connect(self.path,timeout=60))
 
-            path = 'fred/series/observations'
 
-            parameters = {'series_id':series_id,
-              'realtime_start':observation_date,
-              'realtime_end':observation_date,
-              'file_type':'json'
-             }
+    def clear(self):
 
-            r = fred_api_request(api_key=api_key,path=path,parameters=parameters)
-            results = r.json()
+        # Removes all stored values.
 
-            data = pd.DataFrame(results['observations'],columns =['date','value'])
-            data = data.replace('.', np.nan)
-            data['date'] = pd.to_datetime(data['date'])
-            
-            data = data.set_index('date')['value'].astype(float)
+        with self._connect() as connection, connection:
+            connection.execute('DELETE FROM {}'.format(self.table))
 
-            self.data = data
-            self.date_range = 'Range: '+str(self.data.index[0])[:10]+' to '+str(self.data.index[-1])[:10]
 
+    def get(self,key):
 
+        # Returns the value stored for key or None if no value is stored or the value has expired.
 
-            path = 'fred/series/release'
+        now = time.time()
 
-            parameters = {'series_id':series_id,
-              'realtime_start':observation_date,
-              'realtime_end':observation_date,
-              'file_type':'json'
-             }
+        with self._connect() as connection, connection:
+            row = connection.execute('SELECT content, expires FROM {} WHERE key = ?'.format(self.table),(key,)).fetchone()
 
-            r = fred_api_request(api_key=api_key,path=path,parameters=parameters)
-            results = r.json()
+            if row is None:
+                return None
 
-            self.release = results['releases'][0]['name']
-            release_id = results['releases'][0]['id']
+            if row[1] is not None and row[1] < now:
+                connection.execute('DELETE FROM {} WHERE key = ?'.format(self.table),(key,))
+                return None
 
+            connection.execute('UPDATE {} SET accessed = ? WHERE key = ?'.format(self.table),(now,key))
 
-            path = 'fred/release/sources'
+        return zlib.decompress(row[0])
 
-            parameters = {'series_id':series_id,
-              'release_id':release_id,
-              'file_type':'json'
-             }
 
-            r = fred_api_request(api_key=api_key,path=path,parameters=parameters)
-            results = r.json()
+    def put(self,key,content,max_size,expires=None):
 
-            self.source = results['sources'][0]['name']
+        # Stores content (bytes) for key until expires (time in seconds since the epoch, or None)
+        # and evicts the least recently used values if the stored values exceed max_size megabytes.
 
-        else:
+        content = zlib.compress(content)
 
-            self.date_range = ''
-            self.data = pd.Series([],pd.to_datetime([]))
-            self.frequency = ''
-            self.frequency_short = ''
-            self.last_updated = ''
-            self.notes = ''
-            self.observation_date = ''
-            self.release = ''
-            self.seasonal_adjustment = ''
-            self.seasonal_adjustment_short = ''
-            self.series_id = ''
-            self.source = ''
-            self.t = 0
-            self.title = ''
-            self.units = ''
-            self.units_short = ''
+        with self._connect() as connection, connection:
+            connection.execute('INSERT OR REPLACE INTO {} VALUES (?, ?, ?, ?, ?)'.format(self.table),
+                               (key,content,len(content),time.time(),expires))
 
-    
-    def apc(self,log=False,method='backward'):
+            total = connection.execute('SELECT COALESCE(SUM(size), 0) FROM {}'.format(self.table)).fetchone()[0]
+            excess = total - max_size*1024**2
 
-        '''Computes the percentage change in the data over one year.
+            if excess > 0:
+                evicted = []
+                for key, size in connection.execute('SELECT key, size FROM {} ORDER BY accessed'.format(self.table)):
+                    if excess <= 0:
+                        break
+                    evicted.append((key,))
+                    excess-=size
+
+                connection.executemany('DELETE FROM {} WHERE key = ?'.format(self.table),evicted)
+
+
+class request_cache:
+
+    '''Defines a class for storing FRED API responses in a SQLite database on disk. Responses are
+    keyed on the API path and query parameters (excluding the API key). A response to a query with
+    a realtime_end date in the past never changes and is kept until evicted. Other responses expire
+    after ttl seconds. When the stored responses exceed max_size, the least recently used responses
+    are evicted.
+
+    To enable the cache, assign an instance to fredpy.cache:
+
+        fredpy.cache = fredpy.request_cache('fredpy_cache.sqlite')
+    '''
+
+    def __init__(self,path='fredpy_cache.sqlite',max_size=256,ttl=3600):
+
+        '''Initializes an instance of the request_cache class.
 
         Args:
-            log (bool):         If True, computes the percentage change as 100⋅log[x(t)/x(t-k)], where k is
-                                    the number of observations per year.
-                                If False (default), compute the percentage change as 100⋅[x(t)/x(k−1)−1].
-            method (string):    If ‘backward’ (default), compute percentage change from the previous period. 
-                                If ‘forward’, compute percentage change from current to subsequent period.
+            path (string):              location of the SQLite database file. Created if it does not exist.
+            max_size (int or float):    maximum size in megabytes of the (compressed) stored responses.
+                                            Default: 256
+            ttl (int or float):         number of seconds that responses to queries for current data
+                                            remain valid. Default: 3600
 
         Returns:
-            fredpy series
+            None
         '''
 
-        new_series = self.copy()
-        
-        T = len(self.data)
-        t = self.t
+        self.path = os.path.expanduser(path)
+        self.max_size = max_size
+        self.ttl = ttl
+        self._database = _sqlite_store(self.path,'responses')
 
-        if log==True:
-            if method=='backward':
-                new_series.data = 100*np.log(self.data/self.data.shift(t)).dropna()
-            else:
-                new_series.data = 100*np.log(self.data.shift(-t)/self.data).dropna()
-        
 
-        else:
-            if method=='backward':
-                new_series.data = 100*(self.data/self.data.shift(t)-1).dropna()
-            else:
-                new_series.data = 100*(self.data.shift(-t)/self.data-1).dropna()
+    def clear(self):
 
+        '''Removes all stored responses.
 
-        new_series.units = 'Percent'
-        new_series.units_short = '%'
-        new_series.title = 'Annual Percentage Change in '+self.title
-        new_series.date_range = 'Range: '+str(new_series.data.index[0])[:10]+' to '+str(new_series.data.index[-1])[:10]
+        Args:
 
-        return new_series
+        Returns:
+            None
+        '''
 
-    
-    def as_frequency(self,freq=None,method='mean'):
+        self._database.clear()
 
-        '''Convert a fredpy series to a lower frequency.
+
+    def get(self,path,parameters):
+
+        '''Returns the stored response to a FRED API query or None if the response is not stored or
+        has expired.
 
         Args:
-            freq (string):      Abbreviation of desired frequency: 'D','W','M','Q','A'
-            method (string):    How to resample the data: 'first', 'last', 'mean' (default), 'median',
-                                    'min', 'max', 'sum'
+            path (string):      API path.
+            parameters (dict):  query parameters.
+
         Returns:
-            fredpy series
+            requests.models.Response or None
         '''
 
-        new_series = self.copy()
+        content = self._database.get(self.key(path,parameters))
 
-        obs_per_year = {'D':365,'W':52,'M':12,'Q':4,'A':1}
-        map_of_freqency_abbreviations = {'D':'Daily','W':'Weekly','M':'Monthly','Q':'Quarterly','A':'Annual'}
+        if content is None:
+            return None
 
+        r = requests.models.Response()
+        r.status_code = 200
+        r.encoding = 'utf-8'
+        r._content = content
+        r._content_consumed = True
 
-        try:
-            new_series.t = obs_per_year[freq]
-            new_series.frequency_short=freq
-            new_series.frequency=map_of_freqency_abbreviations[freq]
+        return r
 
-        except:
-            raise ValueError("freq must be 'D', 'W', 'M', 'Q', or 'A'")
 
-        if self.t<new_series.t:
-            warnings.warn('Warning: You are converting series to a higher frequency and this method may not behave as you expect.')
+    @staticmethod
+    def key(path,parameters):
 
-        map_to_pandas_frequencies = {'D':'D','W':'W','M':'MS','Q':'QS','A':'AS'}
+        '''Returns the key identifying a FRED API query.
 
-        if method == 'first':
+        Args:
+            path (string):      API path.
+            parameters (dict):  query parameters.
 
-            new_series.data = self.data.resample(map_to_pandas_frequencies[freq]).first()
+        Returns:
+            string
+        '''
 
-        elif method == 'last':
+        parameters = {k:str(v) for k,v in parameters.items() if k != 'api_key'}
 
-            new_series.data = self.data.resample(map_to_pandas_frequencies[freq]).last()
+        return path+'?'+json.dumps(parameters,sort_keys=True)
 
-        elif method == 'mean':
 
-            new_series.data = self.data.resample(map_to_pandas_frequencies[freq]).mean()
+    def put(self,path,parameters,content):
 
-        elif method == 'median':
+        '''Stores the response to a FRED API query and evicts the least recently used responses if
+        the cache exceeds max_size.
 
-            new_series.data = self.data.resample(map_to_pandas_frequencies[freq]).median()
+        Args:
+            path (string):      API path.
+            parameters (dict):  query parameters.
+            content (bytes):    body of the response.
 
-        elif method == 'min':
+        Returns:
+            None
+        '''
 
-            new_series.data = self.data.resample(map_to_pandas_frequencies[freq]).min()
+        today = datetime.datetime.today().strftime('%Y-%m-%d')
 
-        elif method == 'max':
+        if str(parameters.get('realtime_end',today)) < today:
+            expires = None
+        else:
+            expires = time.time()+self.ttl
 
-            new_series.data = self.data.resample(map_to_pandas_frequencies[freq]).max()
+        self._database.put(self.key(path,parameters),content,self.max_size,expires)
 
-        elif method == 'sum':
 
-            new_series.data = self.data.resample(map_to_pandas_frequencies[freq]).sum()
+# Assign an instance of request_cache to store responses from the FRED API
+cache = None
 
-        new_series.date_range = 'Range: '+str(new_series.data.index[0])[:10]+' to '+str(new_series.data.index[-1])[:10]
 
-        return new_series
+######################################################################################################
+# Cache for results of series transformations
 
-    
-    def bp_filter(self,low=6,high=32,K=12):
+class result_cache:
 
-        '''Computes the bandpass (Baxter-King) filter of the data. Returns two fredpy.series
-        instances containing the cyclical and trend components of the data:
+    '''Defines a class for storing the results of the filters and frequency conversion of series so
+    that repeated calls with the same data and arguments return the stored results instead of
+    recomputing them. The results of hp_filter(), bp_filter(), and cf_filter() are stored. Results
+    are keyed on a hash of the data values and dates, the descriptive attributes of the series, the
+    method, and its arguments, so a series whose data are replaced, e.g., by refresh(), gets new
+    results. The hash of the data is computed once and kept with the series until new data are
+    assigned, so changes made to the data in place are not detected. Results are kept in memory
+    and, if path is given, in a SQLite database on disk that can be shared by processes and
+    sessions. When the stored results exceed max_size or max_disk_size, the least recently used
+    results are evicted.
 
-            new_series_cycle,new_series_trend
+    To enable the cache, assign an instance to fredpy.memo:
 
-        .. Note: 
-            In computing the bandpass filter, K observations are lost from each end of the
-            original series to the data are 2K elements shorter than in the original series.
+        fredpy.memo = fredpy.result_cache()
+
+    The returned series share their data with the stored results. Copy the data before modifying them
+    in place. Results on disk are stored with pickle, so only use database files that you trust.
+    '''
+
+    def __init__(self,max_size=64,path=None,max_disk_size=256):
+
+        '''Initializes an instance of the result_cache class.
 
         Args:
-            low (int):  Minimum period for oscillations. Select 24 for monthly data, 6 for quarterly 
-                        data (default), and 3 for annual data.
-            high (int): Maximum period for oscillations.  Select 84 for monthly data, 32 for quarterly 
-                        data (default), and 8 for annual data.
-            K (int):    Lead-lag length of the filter. Select, 84 for monthly data, 12 for for quarterly
-                        data (default), and 1.5 for annual data.
+            max_size (int or float):        maximum size in megabytes of the results kept in memory.
+                                                Default: 64
+            path (string):                  location of the SQLite database file. Created if it does
+                                                not exist. Default: None, i.e., results are only kept
+                                                in memory.
+            max_disk_size (int or float):   maximum size in megabytes of the (compressed) results
+                                                stored on disk. Default: 256
 
         Returns:
-            two fredpy.series instances
+            None
         '''
 
-        new_series_cycle = self.copy()
-        new_series_trend = self.copy()
+        self.max_size = max_size
+        self.max_disk_size = max_disk_size
+        self._results = collections.OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
 
-        if low==6 and high==32 and K==12 and self.t !=4:
-            print('Warning: data frequency is not quarterly!')
-        elif low==3 and high==8 and K==1.5 and self.t !=1:
-            print('Warning: data frequency is not annual!')
-            
-        cycle = tsa.filters.bkfilter(self.data,low=low,high=high,K=K)
-        actual = self.data.iloc[K:-K]
-        trend = actual - cycle
-        
-        new_series_cycle.data = cycle
-        new_series_cycle.units = 'Deviation relative to trend'
-        new_series_cycle.units_short = 'Dev. rel. to trend'
-        new_series_cycle.title = self.title+' - deviation relative to trend (bandpass filtered)'
-        new_series_cycle.date_range = 'Range: '+str(new_series_cycle.data.index[0])[:10]+' to '+str(new_series_cycle.data.index[-1])[:10]
+        if path is None:
+            self.path = None
+            self._database = None
+        else:
+            self.path = os.path.expanduser(path)
+            self._database = _sqlite_store(self.path,'results')
 
-        new_series_trend.data = trend
-        new_series_trend.title = self.title+' - trend (bandpass filtered)'
-        new_series_trend.date_range = 'Range: '+str(new_series_trend.data.index[0])[:10]+' to '+str(new_series_trend.data.index[-1])[:10]
 
-        return new_series_cycle,new_series_trend
+    def _store(self,key,result):
 
+        # Keeps result in memory and evicts the least recently used results if the data of the
+        # results in memory exceed max_size.
 
-    def cf_filter(self,low=6,high=32):
+        if isinstance(result,tuple):
+            size = sum(item.data.nbytes+item.data.index.nbytes for item in result)
+        else:
+            size = result.data.nbytes+result.data.index.nbytes
 
-        '''Computes the Christiano-Fitzgerald (CF) filter of the data. Returns two fredpy.series
-        instances containing the cyclical and trend components of the data:
+        with self._lock:
+            if key in self._results:
+                self._size-=self._results.pop(key)[1]
 
-            new_series_cycle,new_series_trend
+            self._results[key] = (result,size)
+            self._size+=size
 
-        Returns:
-            two fredpy.series instances
-        '''
+            while self._size > self.max_size*1024**2 and len(self._results)>1:
+                self._size-=self._results.popitem(last=False)[1][1]
 
-        new_series_cycle = self.copy()
-        new_series_trend = self.copy()
 
-        if low==6 and high==32 and self.t !=4:
-            print('Warning: data frequency is not quarterly!')
-        elif low==1.5 and high==8 and self.t !=4:
-            print('Warning: data frequency is not quarterly!')
+    def clear(self):
 
-        actual = self.data
-        cycle, trend = tsa.filters.cffilter(self.data,low=low, high=high, drift=False)
+        '''Removes all stored results.
 
-        new_series_cycle.data = cycle
-        new_series_cycle.units = 'Deviation relative to trend'
-        new_series_cycle.units_short = 'Dev. rel. to trend'
-        new_series_cycle.title = self.title+' - deviation relative to trend (CF filtered)'
+        Args:
 
-        new_series_trend.data = trend
-        new_series_trend.title = self.title+' - trend (CF filtered)'
+        Returns:
+            None
+        '''
 
-        return new_series_cycle,new_series_trend
+        with self._lock:
+            self._results.clear()
+            self._size = 0
 
-    
-    def copy(self):
+        if self._database is not None:
+            self._database.clear()
 
-        '''Returns a copy of a series object.
+
+    def get(self,key):
+
+        '''Returns the stored result for key or None if no result is stored.
 
         Args:
+            key (string):   key returned by result_cache.key().
 
-        Returs:
-            fredpy series
+        Returns:
+            fredpy series, tuple of fredpy series, or None
         '''
 
-        new_series = series()
+        with self._lock:
+            if key in self._results:
+                self._results.move_to_end(key)
+                return self._results[key][0]
 
+        if self._database is None:
+            return None
 
-        new_series.data = self.data
-        new_series.date_range = self.date_range
-        new_series.frequency = self.frequency
-        new_series.frequency_short = self.frequency_short
-        new_series.last_updated = self.last_updated
-        new_series.notes = self.notes
-        new_series.release = self.release
-        new_series.seasonal_adjustment = self.seasonal_adjustment
-        new_series.seasonal_adjustment_short = self.seasonal_adjustment_short
-        new_series.series_id = self.series_id
-        new_series.source = self.source
-        new_series.t = self.t
-        new_series.title = self.title
-        new_series.units = self.units
-        new_series.units_short = self.units_short
+        content = self._database.get(key)
 
-        return new_series
+        if content is None:
+            return None
 
+        result = pickle.loads(content)
+        self._store(key,result)
 
-    def diff_filter(self):
+        return result
 
-        '''Computes the first difference filter of original series. Returns two fredpy.series
-        instances containing the cyclical and trend components of the data:
 
-            new_series_cycle,new_series_trend
+    @staticmethod
+    def key(data_series,method,arguments):
 
-        Note:
-            In computing the first difference filter, the first observation from the original series is
-            lost so data are 1 element shorter than in the original series.
+        '''Returns the key identifying the result of a method of a series.
 
         Args:
+            data_series (fredpy series):    series whose method is called.
+            method (string):                name of the method.
+            arguments (dict):               arguments of the method.
 
         Returns:
-            two fredpy.series instances
+            string
         '''
 
+        data = data_series.data
+        attributes = [getattr(data_series,attribute) for attribute in _metadata_attributes]
+
+        # The data are hashed once and the fingerprint is kept with the series until new data are
+        # assigned, so repeated calls only hash the metadata and the arguments
+        if data_series._fingerprint is None:
+            h = hashlib.blake2b(digest_size=16)
+            h.update(str(data.index.dtype).encode())
+            h.update(np.ascontiguousarray(data.index.asi8))
+            h.update(np.ascontiguousarray(data.to_numpy(dtype=float)))
+            data_series._fingerprint = h.digest()
+
+        h = hashlib.blake2b(digest_size=16)
+        h.update(json.dumps([method,arguments,attributes,data_series.date_range,str(data.name)],sort_keys=True,default=str).encode())
+        h.update(data_series._fingerprint)
+
+        return h.hexdigest()
+
+
+    def put(self,key,result):
+
+        '''Stores a result and evicts the least recently used results if the stored results exceed
+        max_size or max_disk_size.
+
+        Args:
+            key (string):                       key returned by result_cache.key().
+            result (fredpy series or tuple):    result to store.
+
+        Returns:
+            None
+        '''
+
+        self._store(key,result)
+
+        if self._database is not None:
+            self._database.put(key,pickle.dumps(result,protocol=pickle.HIGHEST_PROTOCOL),self.max_disk_size)
+
+
+# Assign an instance of result_cache to reuse the results of series filters and frequency conversion
+memo = None
+
+
+######################################################################################################
+# Rate limit for the FRED API
+
+class rate_limiter:
+
+    '''Defines a class for limiting the rate of queries sent to the FRED API with a token bucket.
+    Each query takes a token from a bucket holding up to burst tokens, and the bucket is refilled at a
+    constant rate chosen so that no more than requests_per_minute queries are sent in any minute.
+    When the bucket is empty, queries wait for the next token instead of being rejected by the API.
+
+    All threads in a process share fredpy.limiter. To share a limit between processes, e.g. a pool of
+    workers using the same API key, give each process a limiter with the same lock_file:
+
+        fredpy.limiter = fredpy.rate_limiter(lock_file='/tmp/fredpy.lock')
+    '''
+
+    def __init__(self,requests_per_minute=120,burst=10,lock_file=None):
+
+        '''Initializes an instance of the rate_limiter class.
+
+        Args:
+            requests_per_minute (int):  maximum number of queries in any minute. Default: 120, the
+                                            limit of the FRED API.
+            burst (int):                maximum number of queries sent at once. Default: 10
+            lock_file (string):         path of a file that stores the state of the bucket so that it
+                                            is shared by all processes using the same file. Requires
+                                            fcntl (Unix). Default: None, the bucket is shared by the
+                                            threads of this process only.
+
+        Returns:
+            None
+        '''
+
+        if burst >= requests_per_minute:
+            raise ValueError('burst must be less than requests_per_minute.')
+
+        if lock_file is not None and fcntl is None:
+            raise ValueError('lock_file requires the fcntl module, which is not available on this platform.')
+
+        self.requests_per_minute = requests_per_minute
+        self.burst = burst
+        self.lock_file = lock_file
+        self.rate = (requests_per_minute-burst)/60
+
+        self._tokens = burst
+        self._updated = time.time()
+        self._lock = threading.Lock()
+
+
+    def _take(self,tokens,updated):
+
+        # Takes a token from a bucket with the given state. Returns the new state and the number of
+        # seconds until the token is available. The bucket may be left in debt so that waiting
+        # queries are queued in order.
+
+        now = time.time()
+        tokens = min(self.burst,tokens+(now-updated)*self.rate)-1
+
+        return tokens, now, max(0,-tokens/self.rate)
+
+
+    def reserve(self):
+
+        '''Reserves a token for one query and returns the number of seconds to wait before sending it.
+
+        Args:
+
+        Returns:
+            float
+        '''
+
+        with self._lock:
+
+            if self.lock_file is None:
+                self._tokens, self._updated, wait = self._take(self._tokens,self._updated)
+                return wait
+
+            with open(self.lock_file,'a+') as lock_file:
+                fcntl.flock(lock_file,fcntl.LOCK_EX)
+
+                try:
+                    lock_file.seek(0)
+                    tokens, updated = [float(x) for x in lock_file.read().split()]
+                except ValueError:
+                    tokens, updated = self.burst, time.time()
+
+                tokens, updated, wait = self._take(tokens,updated)
+
+                lock_file.seek(0)
+                lock_file.truncate()
+                lock_file.write(repr(tokens)+' '+repr(updated))
+                lock_file.flush()
+
+                fcntl.flock(lock_file,fcntl.LOCK_UN)
+
+            return wait
+
+
+# Rate limiter used for all queries to the FRED API. Set to None to disable.
+limiter = rate_limiter()
+
+def _throttle():
+
+    # Returns the number of seconds to wait before sending a query. Used by fred_api_request and
+    # fredpy.aio.
+
+    if limiter is None:
+        return 0
+
+    return limiter.reserve()
+
+
+def _retry_delay(request_count):
+
+    # Returns the number of seconds to wait before retrying a failed query: exponential backoff from
+    # 5 seconds up to 2 minutes, with random jitter so that concurrent queries do not retry together.
+
+    return min(120,5*2**request_count)*random.uniform(0.5,1)
+
+
+######################################################################################################
+# The series class and methods
+
+def _observation_date(observation_date):
+
+    # Returns the YYYY-MM-DD vintage date for a query. Defaults to today and expands a YYYY string
+    # to December 31 of that year.
+
+    if observation_date is None:
+
+        observation_date = datetime.datetime.today().strftime('%Y-%m-%d')
+
+    if len(observation_date) == 4:
+
+        observation_date = observation_date+'-12-31'
+
+    return observation_date
+
+
+# Maximum number of observations returned by one fred/series/observations query (the API maximum)
+# and number of threads used to download the remaining pages of longer results.
+_observation_limit = 100000
+_observation_workers = 4
+
+# If True, observations are parsed as the response arrives instead of after the whole response has
+# been read, so that memory use is proportional to the number of observations rather than to the
+# size of the JSON text. Streamed responses are not stored in fredpy.cache.
+stream_observations = False
+
+# Join used to align the dates of two series in arithmetic with the operators +, -, *, and /:
+# 'inner' (dates of both series), 'outer' (dates of either series), 'left', or 'right'. Values that
+# are missing from one of the series on the aligned dates are arithmetic_fill_value, or NaN if None.
+arithmetic_join = 'inner'
+arithmetic_fill_value = None
+
+# Functions, words in titles, and symbols in units of arithmetic with two series
+_arithmetic_operations = {'plus':(operator.add,' plus ',' + '),
+                          'minus':(operator.sub,' minus ',' - '),
+                          'times':(operator.mul,' times ',' * '),
+                          'divide':(operator.truediv,' divided by ',' / ')}
+
+# Descriptive attributes of a series, i.e., all attributes except data and date_range
+_metadata_attributes = ['frequency','frequency_short','last_updated','notes','observation_date','release',
+                        'seasonal_adjustment','seasonal_adjustment_short','series_id','source','t','title',
+                        'units','units_short']
+
+# Observations per year, name, and pandas resampling frequency of the frequencies that series and
+# panels can be converted to with as_frequency()
+_frequencies = {'D':(365,'Daily','D'),
+                'W':(52,'Weekly','W'),
+                'M':(12,'Monthly','MS'),
+                'Q':(4,'Quarterly','QS'),
+                'A':(1,'Annual','YS')}
+
+# Descriptive attributes set by the transformations of series, panels, and lazy series. {} is
+# replaced by the value of the attribute before the transformation. 'ma_centered' is the moving
+# average with center=True.
+_transformations = {'apc':{'title':'Annual Percentage Change in {}','units':'Percent','units_short':'%'},
+                    'log':{'title':'Log {}','units':'Log {}','units_short':'Log {}'},
+                    'ma':{'title':'{} (: two-sided moving average)'},
+                    'ma_centered':{'title':'{} (: one-sided moving average)'},
+                    'pc':{'title':'Percentage Change in {}','units':'Percent','units_short':'%'}}
+
+
+class _series_metadata:
+
+    # Immutable record of the values of the descriptive attributes of a series in the order of
+    # _metadata_attributes. Records are interned: equal records are one object, which is shared by
+    # a series, its copies, and the series derived from it that have the same attributes.
+
+    __slots__ = ['values','__weakref__']
+
+    def __new__(cls,values):
+
+        try:
+            record = _metadata_records.get(values)
+            interned = True
+        except TypeError:
+            # Records with values that cannot be hashed, e.g., lists, are not interned
+            record, interned = None, False
+
+        if record is None:
+            record = object.__new__(cls)
+            object.__setattr__(record,'values',values)
+            if interned:
+                _metadata_records[values] = record
+
+        return record
+
+    def __reduce__(self):
+        return (_series_metadata,(self.values,))
+
+    def __setattr__(self,name,value):
+        raise AttributeError('series metadata records cannot be modified')
+
+
+# Interned metadata records. Records are removed when no series uses them.
+_metadata_records = weakref.WeakValueDictionary()
+
+# Attributes of an empty series
+_empty_metadata = _series_metadata(tuple(0 if attribute=='t' else '' for attribute in _metadata_attributes))
+
+
+def _metadata_property(attribute):
+
+    # Returns a property for a descriptive attribute of a series. The value is read from the
+    # metadata record of the series and setting it replaces the record of that series only. The
+    # release and source of a series created with lazy=True are None until first used.
+
+    position = _metadata_attributes.index(attribute)
+
+    def get(self):
+
+        value = self._metadata.values[position]
+
+        if value is None and self._lazy_date is not None:
+            self._download_release(self._lazy_date)
+            value = self._metadata.values[position]
+
+        return value
+
+    def set(self,value):
+
+        values = list(self._metadata.values)
+        values[position] = value
+        self._metadata = _series_metadata(tuple(values))
+
+    return property(get,set)
+
+
+def _data_property():
+
+    # Returns the property for the data of a series, which are kept in the _data slot. Assigning
+    # data drops the state kept for the previous data: the state of the one-sided HP filter and the
+    # fingerprint that fredpy.memo computed.
+
+    def get(self):
+        return self._data
+
+    def set(self,data):
+        self._data = data
+        self._filter_state = None
+        self._fingerprint = None
+
+    return property(get,set)
+
+
+def _download_observations(parameters,realtime=False,stream=None):
+
+    # Returns the observations from a fred/series/observations query as a dict of arrays (see
+    # _observation_arrays). Results longer than _observation_limit are downloaded in pages using the
+    # limit and offset parameters. The first page gives the total count of observations, and the
+    # remaining pages are downloaded concurrently and appended in order. If stream is None, 
+    # stream_observations is used.
+
+    if stream is None:
+        stream = stream_observations
+
+    path = 'fred/series/observations'
+
+    parameters = dict(parameters,limit=_observation_limit,offset=0)
+
+    def download_page(offset):
+
+        r = fred_api_request(api_key=api_key,path=path,parameters=dict(parameters,offset=offset),stream=stream)
+
+        if stream:
+            with r:
+                return _stream_observation_arrays(r,realtime)
+
+        results = _loads(r.content)
+
+        return _observation_arrays(results['observations'],realtime), results['count']
+
+    arrays, count = download_page(0)
+
+    offsets = range(_observation_limit,count,_observation_limit)
+
+    if len(offsets)>0:
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=_observation_workers) as executor:
+            pages = [arrays]+[page for page,count in executor.map(download_page,offsets)]
+
+        arrays = {field:np.concatenate([page[field] for page in pages]) for field in arrays}
+
+    return arrays
+
+
+def _aligned_values(values_list,dates_list,observed=False):
+
+    # Returns a 2-D array with the 1-D arrays in values_list as columns and a DatetimeIndex of their
+    # dates, which are the datetime64 arrays in dates_list. If the dates differ, the arrays are
+    # aligned on the union of the dates with NaN for missing observations. If observed is True, 
+    # also returns a 2-D boolean array that is True on the dates on which each array has a value.
+
+    if len(dates_list)>0 and all(len(dates)==len(dates_list[0]) and np.array_equal(dates,dates_list[0]) for dates in dates_list[1:]):
+
+        dates = pd.DatetimeIndex(dates_list[0],name='date')
+        values = np.empty((len(dates),len(values_list)))
+        mask = np.ones(values.shape,dtype=bool)
+
+        for j, column in enumerate(values_list):
+            values[:,j] = column
+
+    else:
+
+        dates = pd.DatetimeIndex(np.unique(np.concatenate([dates.astype('datetime64[ns]') for dates in dates_list]+[np.array([],dtype='datetime64[ns]')])),name='date')
+        values = np.full((len(dates),len(values_list)),np.nan)
+        mask = np.zeros(values.shape,dtype=bool)
+
+        for j, (column, column_dates) in enumerate(zip(values_list,dates_list)):
+            positions = dates.get_indexer(column_dates)
+            values[positions,j] = column
+            mask[positions,j] = True
+
+    if observed:
+        return values, dates, mask
+
+    return values, dates
+
+
+def _align(data1,data2,join,fill_value):
+
+    # Returns the values of data1 and data2 (pandas Series with sorted dates) on common dates and
+    # the dates. If the dates differ, they are aligned with a merge of the sorted dates given by
+    # join ('inner', 'outer', 'left', or 'right') and missing values are fill_value, or NaN if None.
+    # If join is None, the dates must be equal.
+
+    index1, index2 = data1.index, data2.index
+    values1, values2 = data1.to_numpy(), data2.to_numpy()
+
+    if index1 is index2:
+        return values1, values2, index1
+
+    # The dates are compared as datetime64 arrays, which is faster than comparing the indexes, and
+    # all of the dates are only compared if the first and last dates are equal
+    dates1, dates2 = index1.values, index2.values
+    same_dtype = dates1.dtype==dates2.dtype
+
+    if same_dtype:
+        same_dates = len(dates1)==len(dates2) and (len(dates1)==0 or dates1[0]==dates2[0] and dates1[-1]==dates2[-1] and np.array_equal(dates1,dates2))
+    else:
+        same_dates = index1.equals(index2)
+
+    if same_dates:
+        return values1, values2, index1
+
+    if join is None:
+        raise ValueError('object1 and object2 do not have the same observation dates')
+
+    if join not in ['inner','outer','left','right']:
+        raise ValueError("join must be 'inner', 'outer', 'left', or 'right'")
+
+    # Series with the same frequency that span different periods have the same dates where they 
+    # overlap, so the inner join is a slice of each. Index.join is only needed if the dates in the
+    # overlap differ.
+    if join == 'inner' and same_dtype and len(dates1)>0 and len(dates2)>0:
+        start, end = max(dates1[0],dates2[0]), min(dates1[-1],dates2[-1])
+        first1, last1 = dates1.searchsorted(start), dates1.searchsorted(end,side='right')
+        first2, last2 = dates2.searchsorted(start), dates2.searchsorted(end,side='right')
+
+        if last1-first1==last2-first2 and np.array_equal(dates1[first1:last1],dates2[first2:last2]):
+            return values1[first1:last1], values2[first2:last2], index1[first1:last1]
+
+    index, indexer1, indexer2 = index1.join(index2,how=join,return_indexers=True)
+
+    if fill_value is None:
+        fill_value = np.nan
+
+    def take(values,indexer):
+
+        # indexer is None if the dates are the dates of values and -1 where a date is missing. 
+        # Consecutive positions are sliced instead of copied.
+        if indexer is None:
+            return values
+
+        missing = indexer==-1
+
+        if missing.any():
+            return np.where(missing,fill_value,values[indexer])
+        elif len(indexer)==0 or indexer[-1]-indexer[0]==len(indexer)-1:
+            return values[indexer[0]:indexer[0]+len(indexer)] if len(indexer)>0 else values[:0]
+        else:
+            return values[indexer]
+
+    return take(values1,indexer1), take(values2,indexer2), index
+
+
+def _arithmetic(object1,object2,operation,join=None,fill_value=None):
+
+    # Returns the result of operation ('plus', 'minus', 'times', or 'divide') with object1 and
+    # object2. If both objects are series, the dates are aligned by _align and the descriptive
+    # attributes are combined by _combine_metadata.
+
+    function = _arithmetic_operations[operation][0]
+
+    if not isinstance(object1,series) and not isinstance(object2,series):
+
+        return function(object1,object2)
+
+    elif not isinstance(object1,series):
+
+        new_series = object2.copy()
+        new_series.data = function(object1,new_series.data)
+
+        return new_series
+
+    elif not isinstance(object2,series):
+
+        new_series = object1.copy()
+        new_series.data = function(new_series.data,object2)
+
+        return new_series
+
+    values1, values2, index = _align(object1.data,object2.data,join,fill_value)
+
+    if object1.data.name == object2.data.name:
+        name = object1.data.name
+    else:
+        name = None
+
+    new_series = object1.copy()
+    new_series._metadata = _combine_metadata(object1._complete_metadata(),object2._complete_metadata(),operation)
+    new_series.data = pd.Series(function(values1,values2),index=index,name=name,copy=False)
+
+    if len(index)>0:
+        new_series.date_range = 'Range: '+str(index[0])[:10]+' to '+str(index[-1])[:10]
+    else:
+        new_series.date_range = 'Range: Null'
+
+    return new_series
+
+
+@functools.lru_cache(maxsize=32)
+def _bk_weights(low,high,K):
+
+    # Returns the 2K+1 symmetric weights of the Baxter-King filter, computed like 
+    # statsmodels.tsa.filters.bkfilter.
+
+    omega_1 = 2*np.pi/high
+    omega_2 = 2*np.pi/low
+
+    j = np.arange(1,K+1)
+    weights = (np.sin(omega_2*j)-np.sin(omega_1*j))/(np.pi*j)
+
+    weights = np.concatenate([weights[::-1],[(omega_2-omega_1)/np.pi],weights])
+    weights-=weights.mean()
+    weights.flags.writeable = False
+
+    return weights
+
+
+def _bk_filter(values,low,high,K):
+
+    # Returns the Baxter-King cycle of values (1-D array or 2-D array with a series in each column).
+    # The result has 2K fewer rows than values. Each row is the product of a window of 2K+1 rows of 
+    # values with the weights.
+
+    windows = np.lib.stride_tricks.sliding_window_view(values,2*K+1,axis=0)
+
+    return windows@_bk_weights(low,high,K)
+
+
+@functools.lru_cache(maxsize=32)
+def _cf_weights(T,low,high):
+
+    # Returns the weights of the Christiano-Fitzgerald filter (drift=False) for T observations as
+    # computed by statsmodels.tsa.filters.cffilter. The TxT weight matrix is the symmetric Toeplitz
+    # matrix of the ideal band-pass weights B(|i-j|) for the interior observations plus weights A(i)
+    # and B(i) on the first and last observations, so only the 2T-1 Toeplitz weights (kernel) and 
+    # the vectors A and B are stored.
+
+    a = 2*np.pi/high
+    b = 2*np.pi/low
+
+    j = np.arange(1,T)
+    weights = np.concatenate([[(b-a)/np.pi],(np.sin(b*j)-np.sin(a*j))/(np.pi*j)])
+
+    # sums[n] is the sum of weights[1:n]
+    sums = np.concatenate([[0,0],np.cumsum(weights[1:T-1])])
+
+    i = np.arange(T)
+    B = -0.5*weights[0]-sums[np.maximum(T-1-i,0)]
+    A = -weights[0]-sums[np.maximum(T-1-i,0)]-sums[i]-B
+
+    kernel = np.concatenate([weights[:0:-1],weights])
+
+    for array in [kernel,A,B]:
+        array.flags.writeable = False
+
+    return kernel, A, B
+
+
+def _cf_filter(values,low,high):
+
+    # Returns the Christiano-Fitzgerald cycle of values (1-D array or 2-D array with a series in 
+    # each column). The Toeplitz part of the weight matrix is applied by FFT convolution.
+
+    from scipy.signal import fftconvolve
+
+    # Same validation as statsmodels.tsa.filters.cffilter
+    if low < 2:
+        raise ValueError('low must be >= 2')
+
+    T = len(values)
+    kernel, A, B = _cf_weights(T,float(low),float(high))
+
+    x = values.reshape(T,-1)
+
+    interior = x.copy()
+    interior[[0,-1]] = 0
+
+    cycle = fftconvolve(interior,kernel[:,None],mode='full',axes=0)[T-1:2*T-1]
+    cycle+=A[:,None]*x[0]+B[:,None]*x[-1]
+    cycle[0]+=kernel[T-1]*x[0]
+    cycle[-1]+=kernel[T-1]*x[-1]
+
+    return cycle.reshape(values.shape)
+
+
+@functools.lru_cache(maxsize=256)
+def _combine_metadata(metadata1,metadata2,operation):
+
+    # Returns the metadata record of the result of operation ('plus', 'minus', 'times', or 'divide')
+    # with two series that have the records metadata1 and metadata2. Records are interned, so the
+    # record of repeated arithmetic with the same series is combined once.
+
+    attributes1 = dict(zip(_metadata_attributes,metadata1.values))
+    attributes2 = dict(zip(_metadata_attributes,metadata2.values))
+    word, symbol = _arithmetic_operations[operation][1:]
+
+    def either(attribute):
+        if attributes1[attribute] == attributes2[attribute]:
+            return attributes1[attribute]
+        else:
+            return attributes1[attribute]+' and '+attributes2[attribute]
+
+    attributes = dict(zip(_metadata_attributes,_empty_metadata.values))
+
+    attributes['title'] = attributes1['title']+word+attributes2['title']
+    attributes['source'] = either('source')
+    attributes['frequency'] = attributes1['frequency']
+    attributes['frequency_short'] = attributes1['frequency_short']
+    attributes['units'] = attributes1['units']+symbol+attributes2['units']
+    attributes['units_short'] = attributes1['units_short']+symbol+attributes2['units_short']
+    attributes['t'] = attributes1['t']
+
+    if attributes1['seasonal_adjustment'] == attributes2['seasonal_adjustment']:
+        attributes['seasonal_adjustment'] = attributes1['seasonal_adjustment']
+        attributes['seasonal_adjustment_short'] = attributes1['seasonal_adjustment_short']
+    else:
+        attributes['seasonal_adjustment'] = attributes1['seasonal_adjustment']+' and '+attributes2['seasonal_adjustment']
+        attributes['seasonal_adjustment_short'] = attributes1['seasonal_adjustment_short']+' and '+attributes2['seasonal_adjustment_short']
+
+    attributes['last_updated'] = either('last_updated')
+    attributes['release'] = either('release')
+    attributes['series_id'] = attributes1['series_id']+' and '+attributes2['series_id']
+
+    return _series_metadata(tuple(attributes[attribute] for attribute in _metadata_attributes))
+
+
+@functools.lru_cache(maxsize=32)
+def _hp_factor(T,lamb):
+
+    # Returns the banded Cholesky factor of I + lamb*K'K, where K is the (T-2)xT second difference
+    # matrix, in the upper form used by scipy.linalg.cho_solve_banded. The matrix depends only on T
+    # and lamb, so the factor is cached and reused for every series of the same length.
+
+    from scipy.linalg import cholesky_banded
+
+    main = np.zeros(T)
+    main[:-2]+=1
+    main[1:-1]+=4
+    main[2:]+=1
+
+    off = np.zeros(T-1)
+    off[:-1]+=-2
+    off[1:]+=-2
+
+    banded = np.zeros((3,T))
+    banded[0,2:] = lamb
+    banded[1,1:] = lamb*off
+    banded[2] = 1+lamb*main
+
+    factor = cholesky_banded(banded)
+    factor.flags.writeable = False
+
+    return factor
+
+
+def _hp_one_sided(values,lamb,state=None):
+
+    # Returns the one-sided HP trend of values and the state of the recursion after the last value.
+    # The trend at t is the Kalman filter estimate of tau(t) in the model y(t) = tau(t) + e(t),
+    # tau(t) - 2*tau(t-1) + tau(t-2) = u(t) with var(e)/var(u) = lamb, i.e., the last value of the
+    # two-sided HP trend of the data through t. Without a state, the recursion starts from the 
+    # exact posterior of (tau(2),tau(1)) given the first two values: mean (y(2),y(1)) and identity
+    # covariance. Missing values (NaN) after the first two are skipped. The state is a tuple
+    # (tau(t),tau(t-1),P11,P12,P22) and continues the recursion with the values that follow.
+
+    values = [float(value) for value in values]
+    trend = np.empty(len(values))
+    q = 1/lamb
+
+    if state is None:
+
+        if len(values)<2:
+            return np.array(values), None
+
+        trend[:2] = values[:2]
+        state = (values[1],values[0],1.0,0.0,1.0)
+        start = 2
+
+    else:
+        start = 0
+
+    x0, x1, p00, p01, p11 = state
+
+    for t in range(start,len(values)):
+
+        # Predict with tau(t) = 2*tau(t-1) - tau(t-2) + u(t)
+        x0, x1 = 2*x0-x1, x0
+        p00, p01, p11 = 4*p00-4*p01+p11+q, 2*p00-p01, p00
+
+        # Update with y(t) = tau(t) + e(t)
+        y = values[t]
+        if y == y:
+            s = p00+1
+            k0, k1 = p00/s, p01/s
+            error = y-x0
+            x0, x1 = x0+k0*error, x1+k1*error
+            p00, p01, p11 = p00-k0*p00, p01-k0*p01, p11-k1*p01
+
+        trend[t] = x0
+
+    return trend, (x0,x1,p00,p01,p11)
+
+
+def _hp_trend(values,lamb):
+
+    # Returns the HP trend of values (1-D array or 2-D array with a series in each column) by 
+    # solving (I + lamb*K'K)*trend = values for all of the columns at once. Columns with missing
+    # values have missing trends.
+
+    from scipy.linalg import cho_solve_banded
+
+    return cho_solve_banded((_hp_factor(len(values),float(lamb)),False),values,check_finite=False)
+
+
+def _memoize(method):
+
+    # Decorates a series method so that its result is stored in fredpy.memo and reused when the
+    # method is called again with the same data and arguments. Copies of the stored series are
+    # returned so that changing the attributes of a result does not change the stored result.
+
+    signature = inspect.signature(method)
+
+    @functools.wraps(method)
+    def memoized_method(self,*args,**kwargs):
+
+        if memo is None:
+            return method(self,*args,**kwargs)
+
+        arguments = signature.bind(self,*args,**kwargs)
+        arguments.apply_defaults()
+        arguments = {name:value for name,value in arguments.arguments.items() if name!='self'}
+
+        key = memo.key(self,method.__name__,arguments)
+        result = memo.get(key)
+
+        if result is None:
+            result = method(self,*args,**kwargs)
+            memo.put(key,result)
+
+        if isinstance(result,tuple):
+            return tuple(item.copy() for item in result)
+        else:
+            return result.copy()
+
+    return memoized_method
+
+
+def _new_series(data,metadata):
+
+    # Returns a fredpy series with data (pandas Series) and the metadata record metadata. The slots
+    # are assigned directly, so the empty data that series() creates are not allocated.
+
+    new_series = series.__new__(series)
+
+    new_series.data = data
+    new_series._metadata = metadata
+    new_series._lazy_date = None
+    new_series._filter_state = None
+
+    dates = data.index.values
+
+    if len(dates)>0:
+        new_series.date_range = 'Range: '+str(dates[0])[:10]+' to '+str(dates[-1])[:10]
+    else:
+        new_series.date_range = 'Range: Null'
+
+    return new_series
+
+
+def _observation_arrays(observations,realtime=False):
+
+    # Returns the observations from a fred/series/observations query as a dict of arrays: 'date'
+    # (datetime64[D]) and 'value' (float64, missing values ('.') are NaN), and 'realtime_start' and 
+    # 'realtime_end' (datetime64[D]) if realtime is True. NumPy parses the fixed YYYY-MM-DD format.
+
+    nan = float('nan')
+
+    arrays = {'date':np.array([o['date'] for o in observations],dtype='datetime64[D]'),
+              'value':np.fromiter([nan if o['value'] == '.' else float(o['value']) for o in observations],dtype=float,count=len(observations))}
+
+    if realtime:
+        arrays['realtime_start'] = np.array([o['realtime_start'] for o in observations],dtype='datetime64[D]')
+        arrays['realtime_end'] = np.array([o['realtime_end'] for o in observations],dtype='datetime64[D]')
+
+    return arrays
+
+
+def _parse_observations(arrays):
+
+    # Returns observations from _download_observations as a Pandas Series with dates as index.
+
+    dates = arrays['date'].astype('datetime64[ns]')
+
+    return pd.Series(arrays['value'],index=pd.DatetimeIndex(dates,name='date'),name='value')
+
+
+def _series_names(series_list):
+
+    # Returns the names of the series in series_list and a list of the series. If series_list is a
+    # dict, the keys are the names, otherwise the series IDs are. Used by panel and _series_table.
+
+    if type(series_list) == dict:
+        names = [str(name) for name in series_list.keys()]
+        series_list = list(series_list.values())
+    else:
+        names = [s.series_id for s in series_list]
+
+    if len(set(names)) < len(names):
+        raise ValueError('Names of the series must be unique. Pass a dict to set the names.')
+
+    return names, series_list
+
+
+def _series_table(series_list):
+
+    # Returns a pyarrow Table with a 'date' column (timestamp[ns]) and a float64 column for each 
+    # series in series_list (list or dict, see write_parquet). Dates on which a series has no 
+    # observation are null values. The attributes of the series are stored as JSON in the schema
+    # metadata under the key 'fredpy'.
+
+    import pyarrow as pa
+
+    names, series_list = _series_names(series_list)
+    values, dates, observed = _aligned_values([s.data.to_numpy(dtype=float) for s in series_list],[s.data.index.values for s in series_list],observed=True)
+
+    columns = {'date':pa.array(dates.values.astype('datetime64[ns]'))}
+
+    for j, name in enumerate(names):
+        columns[name] = pa.array(values[:,j],mask=~observed[:,j])
+
+    metadata = {name:{attribute:getattr(s,attribute) for attribute in _metadata_attributes} for name, s in zip(names,series_list)}
+
+    return pa.table(columns).replace_schema_metadata({'fredpy':json.dumps(metadata)})
+
+
+def _stream_observation_arrays(r,realtime=False):
+
+    # Parses the observations from a streamed fred/series/observations response into arrays as they
+    # arrive. Returns the arrays (see _observation_arrays) and the total count of observations. The
+    # arrays are allocated from the count, limit, and offset given before the observations in the
+    # response. Each chunk of the response is parsed up to the last complete observation (the
+    # observations are flat objects without nested braces or brackets) and copied into the arrays,
+    # so only about one chunk of JSON text is held in memory at a time.
+
+    buffer = b''
+    arrays = None
+    count = None
+    done = False
+    n = 0
+
+    for chunk in r.iter_content(chunk_size=2**20):
+
+        buffer+=chunk
+
+        if arrays is None:
+
+            start = buffer.find(b'"observations"')
+            if start<0 or buffer.find(b'[',start)<0:
+                continue
+
+            header = {key.decode():int(value) for key,value in re.findall(rb'"(count|offset|limit)"\s*:\s*(\d+)',buffer[:start])}
+            count = header.get('count')
+
+            if count is None:
+                size = 1024
+            else:
+                size = max(0,min(count-header.get('offset',0),header.get('limit',count)))
+
+            arrays = _observation_arrays([],realtime)
+            arrays = {field:np.empty(size,dtype=array.dtype) for field,array in arrays.items()}
+            buffer = buffer[buffer.find(b'[',start)+1:]
+
+        if done:
+            continue
+
+        # The observations contain no brackets, so the first ']' closes the list of observations
+        end = buffer.find(b']')
+        if end<0:
+            end = buffer.rfind(b'}')+1
+            if end==0:
+                continue
+        else:
+            done = True
+
+        observations = _loads(b'['+buffer[:end].strip(b', \t\r\n')+b']')
+        buffer = buffer[end:]
+
+        new = _observation_arrays(observations,realtime)
+        m = len(observations)
+
+        if n+m > len(arrays['date']):
+            size = max(n+m,2*len(arrays['date']))
+            arrays = {field:np.resize(array,size) for field,array in arrays.items()}
+
+        for field in arrays:
+            arrays[field][n:n+m] = new[field]
+
+        n+=m
+
+    if arrays is None:
+        raise ValueError('FRED API response does not contain observations.')
+
+    if count is None:
+        count = n
+
+    return {field:array[:n] for field,array in arrays.items()}, count
+
+
+def _table_series(table,columns=None):
+
+    # Returns the series in a pyarrow Table created by _series_table: a fredpy series if columns 
+    # is a string or if the table contains one series and columns is None, otherwise a dict of 
+    # fredpy series. Columns without null values are used without copying, so the data of series
+    # observed on all of the dates share the memory of the table (e.g., a memory-mapped file) and
+    # share one index.
+
+    def array(column):
+        if column.num_chunks == 1 and column.null_count == 0:
+            return column.chunk(0).to_numpy(zero_copy_only=True)
+        return column.to_numpy()
+
+    metadata = json.loads(table.schema.metadata[b'fredpy'])
+    dates = pd.DatetimeIndex(array(table.column('date')),name='date',copy=False)
+
+    results = {}
+
+    for name in table.column_names[1:]:
+
+        # Null values mark dates on which the series has no observation
+        column = table.column(name)
+
+        if column.null_count == 0:
+            data = pd.Series(array(column),index=dates,name='value',copy=False)
+        else:
+            observed = column.is_valid().to_numpy(zero_copy_only=False)
+            data = pd.Series(array(column)[observed],index=dates[observed],name='value')
+
+        results[name] = _new_series(data,_series_metadata(tuple(metadata[name][attribute] for attribute in _metadata_attributes)))
+
+    if type(columns) == str or (columns is None and len(results)==1):
+        return next(iter(results.values()))
+
+    return results
+
+
+def _transform_metadata(metadata,name):
+
+    # Sets the descriptive attributes in metadata (dict) that the transformation name changes. See
+    # _transformations.
+
+    for attribute, template in _transformations[name].items():
+        metadata[attribute] = template.format(metadata[attribute])
+
+
+def _vintage_matrix(arrays):
+
+    # Returns real-time periods (see _observation_arrays) as a DataFrame with one row for each vintage
+    # and one column for each observation date. Every change to the data starts a real-time period,
+    # so the vintages with distinct data are the distinct realtime_start dates. Each period fills
+    # the rows of the vintages it spans.
+
+    vintages = np.unique(arrays['realtime_start'])
+    dates, columns = np.unique(arrays['date'],return_inverse=True)
+
+    first = np.searchsorted(vintages,arrays['realtime_start'])
+    lengths = np.searchsorted(vintages,arrays['realtime_end'],side='right')-first
+    offsets = np.arange(lengths.sum())-np.repeat(np.cumsum(lengths)-lengths,lengths)
+
+    matrix = np.full((len(vintages),len(dates)),np.nan)
+    matrix[np.repeat(first,lengths)+offsets,np.repeat(columns,lengths)] = np.repeat(arrays['value'],lengths)
+
+    return pd.DataFrame(matrix,index=pd.DatetimeIndex(vintages.astype('datetime64[ns]'),name='vintage'),
+                        columns=pd.DatetimeIndex(dates.astype('datetime64[ns]'),name='date'))
+
+
+class series:
+
+    '''Defines a class for downloading, storing, and manipulating data from FRED.'''
+
+    # The descriptive attributes are stored in a metadata record that is shared with copies and
+    # derived series instead of in a __dict__ for each series
+    __slots__ = ['_data','date_range','_metadata','_lazy_date','_filter_state','_fingerprint']
+
+    data = _data_property()
+
+    frequency = _metadata_property('frequency')
+    frequency_short = _metadata_property('frequency_short')
+    last_updated = _metadata_property('last_updated')
+    notes = _metadata_property('notes')
+    observation_date = _metadata_property('observation_date')
+    release = _metadata_property('release')
+    seasonal_adjustment = _metadata_property('seasonal_adjustment')
+    seasonal_adjustment_short = _metadata_property('seasonal_adjustment_short')
+    series_id = _metadata_property('series_id')
+    source = _metadata_property('source')
+    t = _metadata_property('t')
+    title = _metadata_property('title')
+    units = _metadata_property('units')
+    units_short = _metadata_property('units_short')
+
+    # NumPy arrays and pandas objects defer to the arithmetic operators of series
+    __array_ufunc__ = None
+    __pandas_priority__ = 5000
+
+    def __init__(self,series_id=None,observation_date=None,lazy=False):
+
+        '''Initializes an instance of the series class.
+
+        Args:
+            series_id (string):     unique FRED series ID. If series_id equals None, an empty series 
+                                        object is created.
+            realtime_end (string):  YYYY-MM-DD formatted state string. Indicates the final date at
+                                        which the series is observed. I.e., excludes revisions made
+                                        after realtime_end. If only YYYY string is provided, month 
+                                        and day are assumed to be December 31.
+            lazy (bool):            If True, only the descriptive attributes are downloaded. data and
+                                        date_range are downloaded when first used, as are release
+                                        and source. Default: False
+
+        Returns:
+            None
+
+        Attributes:
+            data:                       (Pandas Series) data values with dates as index.
+            date_range:                 (string) specifies the dates of the first and last observations.
+            frequency:                  (string) data frequency. 'Daily', 'Weekly', 'Monthly', 'Quarterly', 'Semiannual', or 'Annual'.
+            frequency_short:            (string) data frequency. Abbreviated. 'D', 'W', 'M', 'Q', 'SA, or 'A'.
+            last_updated:               (string) date series was last updated.
+            notes:                      (string) details about series. Not available for all series.
+            observation_date:           (string) vintage date at which data are observed.
+            release:                    (string) statistical release containing data.
+            seasonal_adjustment:        (string) specifies whether the data has been seasonally adjusted.
+            seasonal_adjustment_short:  (string) specifies whether the data has been seasonally adjusted. Abbreviated.
+            series_id:                  (string) unique FRED series ID code.
+            source:                     (string) original source of the data.
+            t:                          (int) number corresponding to frequency: 365 for daily, 52 for weekly, 12 for monthly, 4 for quarterly, and 1 for annual.
+            title:                      (string) title of the data series.
+            units:                      (string) units of the data series.
+            units_short:                (string) units of the data series. Abbreviated.
+        '''
+
+        observation_date = _observation_date(observation_date)
+
+        self._lazy_date = None
+        self._filter_state = None
+        self._fingerprint = None
+
+        if type(series_id) == str:
+
+            if api_key is None:
+                raise ValueError('fredpy.api_key value not assigned. You need to provide your key for the FRED API.')
+
+            self._metadata = _series_metadata((None,)*len(_metadata_attributes))
+
+            path = 'fred/series'
+
+            parameters = {'series_id':series_id,
+              'realtime_start':observation_date,
+              'realtime_end':observation_date,
+              'file_type':'json'
+             }
+
+            r = fred_api_request(api_key=api_key,path=path,parameters=parameters)
+            self._set_metadata(series_id,observation_date,r.json())
+
+            if lazy:
+                self._lazy_date = observation_date
+            else:
+                self._download_data(observation_date)
+                self._download_release(observation_date)
+
+        else:
+
+            self.date_range = ''
+            self.data = pd.Series([],pd.DatetimeIndex([]))
+            self._metadata = _empty_metadata
+
+
+    def __add__(self,other):
+        return plus(self,other,arithmetic_join,arithmetic_fill_value)
+
+
+    def __getattr__(self,name):
+
+        # Only called for attributes that have not been set. Downloads the data of a series created
+        # with lazy=True on first use. The release and source are downloaded by their properties.
+
+        if name in ['data','date_range'] and self._lazy_date is not None:
+            self._download_data(self._lazy_date)
+            return getattr(self,name)
+
+        raise AttributeError(repr(type(self).__name__)+' object has no attribute '+repr(name))
+
+
+    def __mul__(self,other):
+        return times(self,other,arithmetic_join,arithmetic_fill_value)
+
+
+    def __radd__(self,other):
+        return plus(other,self,arithmetic_join,arithmetic_fill_value)
+
+
+    def __rmul__(self,other):
+        return times(other,self,arithmetic_join,arithmetic_fill_value)
+
+
+    def __rsub__(self,other):
+        return minus(other,self,arithmetic_join,arithmetic_fill_value)
+
+
+    def __rtruediv__(self,other):
+        return divide(other,self,arithmetic_join,arithmetic_fill_value)
+
+
+    def __setstate__(self,state):
+
+        # Restores a pickled series. The state is a dict of attributes for series pickled by earlier
+        # versions of fredpy and a pair (None, dict of slots) otherwise.
+
+        if isinstance(state,tuple):
+            state = state[1]
+
+        self._lazy_date = None
+        self._filter_state = None
+        self._fingerprint = None
+        self._metadata = _empty_metadata
+
+        # The filter state and the fingerprint of the data are not restored
+        for name, value in state.items():
+            if name not in ['_filter_state','_fingerprint']:
+                setattr(self,name,value)
+
+
+    def __sub__(self,other):
+        return minus(self,other,arithmetic_join,arithmetic_fill_value)
+
+
+    def __truediv__(self,other):
+        return divide(self,other,arithmetic_join,arithmetic_fill_value)
+
+
+    def _complete_metadata(self):
+
+        # Returns the metadata record. The release and source of a series created with lazy=True
+        # are downloaded first so that the record can be shared.
+
+        if self._lazy_date is not None and None in self._metadata.values:
+            self._download_release(self._lazy_date)
+
+        return self._metadata
+
+
+    def _download_data(self,observation_date):
+
+        # Downloads the observations of the series as observed on observation_date (YYYY-MM-DD).
+
+        parameters = {'series_id':self.series_id,
+          'realtime_start':observation_date,
+          'realtime_end':observation_date,
+          'file_type':'json'
+         }
+
+        self._set_data(_download_observations(parameters))
+
+
+    def _download_release(self,observation_date):
+
+        # Downloads the names of the release and source of the series as of observation_date (YYYY-MM-DD).
+
+        path = 'fred/series/release'
+
+        parameters = {'series_id':self.series_id,
+          'realtime_start':observation_date,
+          'realtime_end':observation_date,
+          'file_type':'json'
+         }
+
+        r = fred_api_request(api_key=api_key,path=path,parameters=parameters)
+        results = r.json()
+
+        self.release = results['releases'][0]['name']
+        release_id = results['releases'][0]['id']
+
+
+        path = 'fred/release/sources'
+
+        parameters = {'series_id':self.series_id,
+          'release_id':release_id,
+          'file_type':'json'
+         }
+
+        r = fred_api_request(api_key=api_key,path=path,parameters=parameters)
+        results = r.json()
+
+        self.source = results['sources'][0]['name']
+
+
+    def _hp_one_sided(self,values,lamb):
+
+        # Returns the one-sided HP trend of values, the data of the series. The number of filtered
+        # observations, the last filtered date, the last state of the recursion, and the trend are
+        # kept in _filter_state. The state is dropped when data are assigned, and refresh() keeps it
+        # only if no filtered observation was revised, so only the observations added since the
+        # last call are filtered. The trend is kept in a buffer with room to grow, so that appending
+        # to it takes time proportional to the number of new observations.
+
+        state = self._filter_state
+        n = len(values)
+
+        if state is not None and state['lamb']==lamb and 0<state['n']<=n and self.data.index[state['n']-1]==state['date']:
+
+            m = state['n']
+            trend, recursion = _hp_one_sided(values[m:],lamb,state['recursion'])
+
+            buffer = state['trend']
+            if len(buffer)<n:
+                buffer = np.concatenate([buffer[:m],np.empty(max(n,2*len(buffer))-m)])
+            buffer[m:n] = trend
+
+        else:
+            buffer, recursion = _hp_one_sided(values,lamb)
+
+        if recursion is not None:
+            self._filter_state = {'lamb':lamb,'n':n,'date':self.data.index[-1],'recursion':recursion,'trend':buffer}
+
+        return buffer[:n]
+
+
+    def _set_data(self,arrays):
+
+        # Sets data and date_range from observations returned by _download_observations.
+
+        self.data = _parse_observations(arrays)
+        self.date_range = 'Range: '+str(self.data.index[0])[:10]+' to '+str(self.data.index[-1])[:10]
+
+
+    def _set_metadata(self,series_id,observation_date,results):
+
+        # Sets the descriptive attributes from the results of a fred/series query.
+
+        self.series_id = series_id
+        self.title = results['seriess'][0]['title']
+        self.frequency = results['seriess'][0]['frequency']
+        self.frequency_short = results['seriess'][0]['frequency_short']
+        self.observation_date = datetime.datetime.strptime(observation_date,"%Y-%m-%d").strftime('%B %d, %Y')
+        self.units = results['seriess'][0]['units']
+        self.units_short = results['seriess'][0]['units_short']
+        self.seasonal_adjustment = results['seriess'][0]['seasonal_adjustment']
+        self.seasonal_adjustment_short = results['seriess'][0]['seasonal_adjustment_short']
+        self.last_updated = results['seriess'][0]['last_updated']
+        
+        try:
+            self.notes = results['seriess'][0]['notes']
+        except:
+            self.notes = ''
+
+        obs_per_year = {'D':365,'W':52,'M':12,'Q':4,'SA':2,'A':1}
+        try:
+            self.t = obs_per_year[self.frequency_short]
+        except:
+            self.t = np.nan
+
+    
+    def _set_transformation(self,name):
+
+        # Sets the descriptive attributes that the transformation name changes. See _transformations.
+
+        metadata = dict(zip(_metadata_attributes,self._metadata.values))
+        _transform_metadata(metadata,name)
+        self._metadata = _series_metadata(tuple(metadata[attribute] for attribute in _metadata_attributes))
+
+
+    def apc(self,log=False,method='backward'):
+
+        '''Computes the percentage change in the data over one year.
+
+        Args:
+            log (bool):         If True, computes the percentage change as 100⋅log[x(t)/x(t-k)], where k is
+                                    the number of observations per year.
+                                If False (default), compute the percentage change as 100⋅[x(t)/x(k−1)−1].
+            method (string):    If ‘backward’ (default), compute percentage change from the previous period. 
+                                If ‘forward’, compute percentage change from current to subsequent period.
+
+        Returns:
+            fredpy series
+        '''
+
+        new_series = self.copy()
+        
+        T = len(self.data)
+        t = self.t
+
+        if log==True:
+            if method=='backward':
+                new_series.data = 100*np.log(self.data/self.data.shift(t)).dropna()
+            else:
+                new_series.data = 100*np.log(self.data.shift(-t)/self.data).dropna()
+        
+
+        else:
+            if method=='backward':
+                new_series.data = 100*(self.data/self.data.shift(t)-1).dropna()
+            else:
+                new_series.data = 100*(self.data.shift(-t)/self.data-1).dropna()
+
+
+        new_series._set_transformation('apc')
+        new_series.date_range = 'Range: '+str(new_series.data.index[0])[:10]+' to '+str(new_series.data.index[-1])[:10]
+
+        return new_series
+
+    
+    def as_frequency(self,freq=None,method='mean'):
+
+        '''Convert a fredpy series to a lower frequency.
+
+        Args:
+            freq (string):      Abbreviation of desired frequency: 'D','W','M','Q','A'
+            method (string):    How to resample the data: 'first', 'last', 'mean' (default), 'median',
+                                    'min', 'max', 'sum'
+        Returns:
+            fredpy series
+        '''
+
+        new_series = self.copy()
+
+        try:
+            new_series.t, new_series.frequency, pandas_frequency = _frequencies[freq]
+            new_series.frequency_short=freq
+
+        except:
+            raise ValueError("freq must be 'D', 'W', 'M', 'Q', or 'A'")
+
+        if self.t<new_series.t:
+            warnings.warn('Warning: You are converting series to a higher frequency and this method may not behave as you expect.')
+
+        if method == 'first':
+
+            new_series.data = self.data.resample(pandas_frequency).first()
+
+        elif method == 'last':
+
+            new_series.data = self.data.resample(pandas_frequency).last()
+
+        elif method == 'mean':
+
+            new_series.data = self.data.resample(pandas_frequency).mean()
+
+        elif method == 'median':
+
+            new_series.data = self.data.resample(pandas_frequency).median()
+
+        elif method == 'min':
+
+            new_series.data = self.data.resample(pandas_frequency).min()
+
+        elif method == 'max':
+
+            new_series.data = self.data.resample(pandas_frequency).max()
+
+        elif method == 'sum':
+
+            new_series.data = self.data.resample(pandas_frequency).sum()
+
+        new_series.date_range = 'Range: '+str(new_series.data.index[0])[:10]+' to '+str(new_series.data.index[-1])[:10]
+
+        return new_series
+
+    
+    @_memoize
+    def bp_filter(self,low=6,high=32,K=12):
+
+        '''Computes the bandpass (Baxter-King) filter of the data. Returns two fredpy.series
+        instances containing the cyclical and trend components of the data:
+
+            new_series_cycle,new_series_trend
+
+        .. Note: 
+            In computing the bandpass filter, K observations are lost from each end of the
+            original series to the data are 2K elements shorter than in the original series.
+
+        Args:
+            low (int):  Minimum period for oscillations. Select 24 for monthly data, 6 for quarterly 
+                        data (default), and 3 for annual data.
+            high (int): Maximum period for oscillations.  Select 84 for monthly data, 32 for quarterly 
+                        data (default), and 8 for annual data.
+            K (int):    Lead-lag length of the filter. Select, 84 for monthly data, 12 for for quarterly
+                        data (default), and 1.5 for annual data.
+
+        Returns:
+            two fredpy.series instances
+        '''
+
+        new_series_cycle = self.copy()
+        new_series_trend = self.copy()
+
+        if low==6 and high==32 and K==12 and self.t !=4:
+            print('Warning: data frequency is not quarterly!')
+        elif low==3 and high==8 and K==1.5 and self.t !=1:
+            print('Warning: data frequency is not annual!')
+            
+        actual = self.data.iloc[K:-K]
+        cycle = pd.Series(_bk_filter(self.data.to_numpy(dtype=float),low,high,K),index=actual.index,name=self.data.name)
+        trend = actual - cycle
+        
+        new_series_cycle.data = cycle
+        new_series_cycle.units = 'Deviation relative to trend'
+        new_series_cycle.units_short = 'Dev. rel. to trend'
+        new_series_cycle.title = self.title+' - deviation relative to trend (bandpass filtered)'
+        new_series_cycle.date_range = 'Range: '+str(new_series_cycle.data.index[0])[:10]+' to '+str(new_series_cycle.data.index[-1])[:10]
+
+        new_series_trend.data = trend
+        new_series_trend.title = self.title+' - trend (bandpass filtered)'
+        new_series_trend.date_range = 'Range: '+str(new_series_trend.data.index[0])[:10]+' to '+str(new_series_trend.data.index[-1])[:10]
+
+        return new_series_cycle,new_series_trend
+
+
+    @_memoize
+    def cf_filter(self,low=6,high=32):
+
+        '''Computes the Christiano-Fitzgerald (CF) filter of the data. Returns two fredpy.series
+        instances containing the cyclical and trend components of the data:
+
+            new_series_cycle,new_series_trend
+
+        Returns:
+            two fredpy.series instances
+        '''
+
+        new_series_cycle = self.copy()
+        new_series_trend = self.copy()
+
+        if low==6 and high==32 and self.t !=4:
+            print('Warning: data frequency is not quarterly!')
+        elif low==1.5 and high==8 and self.t !=4:
+            print('Warning: data frequency is not quarterly!')
+
+        actual = self.data
+        cycle = pd.Series(_cf_filter(actual.to_numpy(dtype=float),low,high),index=actual.index,name=actual.name)
+        trend = actual - cycle
+
+        new_series_cycle.data = cycle
+        new_series_cycle.units = 'Deviation relative to trend'
+        new_series_cycle.units_short = 'Dev. rel. to trend'
+        new_series_cycle.title = self.title+' - deviation relative to trend (CF filtered)'
+
+        new_series_trend.data = trend
+        new_series_trend.title = self.title+' - trend (CF filtered)'
+
+        return new_series_cycle,new_series_trend
+
+    
+    def copy(self):
+
+        '''Returns a copy of a series object.
+
+        Args:
+
+        Returs:
+            fredpy series
+        '''
+
+        new_series = series.__new__(series)
+
+        new_series.data = self.data
+        new_series.date_range = self.date_range
+        new_series._metadata = self._complete_metadata()
+        new_series._lazy_date = None
+        new_series._filter_state = None
+        new_series._fingerprint = self._fingerprint
+
+        return new_series
+
+
+    def diff_filter(self):
+
+        '''Computes the first difference filter of original series. Returns two fredpy.series
+        instances containing the cyclical and trend components of the data:
+
+            new_series_cycle,new_series_trend
+
+        Note:
+            In computing the first difference filter, the first observation from the original series is
+            lost so data are 1 element shorter than in the original series.
+
+        Args:
+
+        Returns:
+            two fredpy.series instances
+        '''
+
+        new_series_cycle = self.copy()
+        new_series_trend = self.copy()
+
+        new_series_cycle.data = self.data.diff().dropna() - self.data.diff().dropna().mean()
+        new_series_cycle.units = 'Deviation relative to trend'
+        new_series_cycle.units_short = 'Dev. rel. to trend'
+        new_series_cycle.date_range = 'Range: '+str(new_series_cycle.data.index[0])[:10]+' to '+str(new_series_cycle.data.index[-1])[:10]
+
+        new_series_trend.data = self.data.shift(1).dropna()
+        new_series_trend.title = self.title+' - trend (first difference filtered)'
+        new_series_trend.date_range = 'Range: '+str(new_series_trend.data.index[0])[:10]+' to '+str(new_series_trend.data.index[-1])[:10]
+
+        return new_series_cycle,new_series_trend
+
+    
+    def divide(self,object2,join=None,fill_value=None):
+
+        '''Divides the data from the current fredpy series by the data from object2.
+
+        Args:
+            object2 (int, float, numpy ndarray, or similar or fredpy series)
+            join (string):          If None (default), the dates of two series must be equal.
+                                        Otherwise, the dates are aligned: 'inner' (dates of both
+                                        series), 'outer' (dates of either series), 'left', or 'right'.
+            fill_value (float):     value of a series on aligned dates on which it has no observation.
+                                        Default: NaN
+
+        Note:
+            You are responsibile for making sure that dividing the series makes sense.
+
+        Returns:
+            fredpy series
+        '''
+
+        return divide(self,object2,join,fill_value)
+
+    def drop_nan(self):
+
+        '''Removes missing (NaN) values.
+
+        Args:
+
+        Returns:
+            fredpy series
+        '''
+
+        new_series = self.copy()
+        
+        new_series.data = new_series.data.dropna()
+        new_series.date_range = 'Range: '+str(new_series.data.index[0])[:10]+' to '+str(new_series.data.index[-1])[:10]
+
+        return new_series
+
+
+    @_memoize
+    def hp_filter(self,lamb=1600,one_sided=False):
+
+        '''Computes the Hodrick-Prescott (HP) filter of the data. Returns two fredpy.series
+        instances containing the cyclical and trend components of the data:
+
+            new_series_cycle,new_series_trend
+
+        Args:
+            lamb (int):         The Hodrick-Prescott smoothing parameter. Select 129600 for monthly data,
+                                    1600 for quarterly data (default), 6.25 for annual data, or 104976000000
+                                    for daily data.
+                        
+                                In general, set lambda to: 1600*[number of observations per quarter]**4
+            one_sided (bool):   If True, computes the one-sided HP filter: the trend at each date is
+                                    the last value of the two-sided trend of the data through that
+                                    date, so the trend does not change when observations are added.
+                                    Computed with a Kalman filter recursion whose last state is kept
+                                    with the series, so that after refresh() only the new 
+                                    observations are filtered. Default: False
+            
+        Returns:
+            two fredpy.series instances
+        '''
+
+        new_series_cycle = self.copy()
+        new_series_trend = self.copy()
+
+        if lamb==1600 and self.t !=4:
+            print('Warning: data frequency is not quarterly!')
+        elif lamb==129600 and self.t !=12:
+            print('Warning: data frequency is not monthly!')
+        elif lamb==6.25 and self.t !=1:
+            print('Warning: data frequency is not annual!')
+            
+        values = self.data.to_numpy(dtype=float)
+
+        if one_sided:
+            trend = pd.Series(self._hp_one_sided(values,lamb),index=self.data.index,name=self.data.name)
+        else:
+            trend = pd.Series(_hp_trend(values,lamb),index=self.data.index,name=self.data.name)
+
+        cycle = self.data-trend
+
+        new_series_cycle.data = cycle
+        new_series_cycle.units = 'Deviation relative to trend'
+        new_series_cycle.units_short = 'Dev. rel. to trend'
+        new_series_cycle.title = self.title+' - deviation relative to trend (HP filtered)'
+
+        new_series_trend.title = self.title+' - trend (HP filtered)'
+        new_series_trend.data = trend
+
+        return new_series_cycle,new_series_trend
+
+    
+    def lazy(self):
+
+        '''Returns a lazy_series for chaining transformations that are evaluated only when the 
+        result is used, e.g.:
+
+            s.lazy().window(['2000-01-01','2020-01-01']).log().pc(annualized=True).ma(4).data
+
+        The methods apc, drop_nan, log, ma, pc, recent, and window of a lazy_series return a new
+        lazy_series. The result is computed with arrays in one pass when data or another attribute 
+        is accessed or when collect() is called.
+
+        Args:
+
+        Returns:
+            fredpy lazy_series
+        '''
+
+        return lazy_series(self)
+
+
+    def linear_filter(self):
+
+        '''Computes a simple linear filter of the data using OLS. Returns two fredpy.series
+        instances containing the cyclical and trend components of the data:
+
+            new_series_cycle,new_series_trend
+
+        Args:
+
+        Returns:
+            two fredpy.series instances
+        '''
+
+        import statsmodels.api as sm
+
         new_series_cycle = self.copy()
         new_series_trend = self.copy()
 
-        new_series_cycle.data = self.data.diff().dropna() - self.data.diff().dropna().mean()
-        new_series_cycle.units = 'Deviation relative to trend'
-        new_series_cycle.units_short = 'Dev. rel. to trend'
-        new_series_cycle.date_range = 'Range: '+str(new_series_cycle.data.index[0])[:10]+' to '+str(new_series_cycle.data.index[-1])[:10]
+        y = self.data
+        time = np.arange(len(self.data))
+        x = np.column_stack([time])
+        x = sm.add_constant(x)
+        model = sm.OLS(y,x)
+        result= model.fit()
+        pred  = result.predict(x)
+        
+        cycle= y-pred
+        trend= pd.Series(pred,index=self.data.index)
+
+        new_series_cycle.data = cycle
+        new_series_cycle.units = 'Deviation relative to trend'
+        new_series_cycle.units_short = 'Dev. rel. to trend'
+        new_series_cycle.title = self.title+' - deviation relative to trend (linearly filtered via OLS)'
+
+        new_series_trend.title = self.title+' - trend (linearly filtered via OLS)'
+        new_series_trend.data = trend
+
+        return new_series_cycle,new_series_trend
+
+    
+    def log(self):
+        
+        '''Computes the natural log of the data
+
+        Args:
+
+        Returns:
+            fredpy series
+        '''
+
+        new_series = self.copy()
+
+        new_series.data = np.log(new_series.data)
+        new_series._set_transformation('log')
+
+        return new_series
+
+    def ma(self,length,center=False):
+
+        '''Computes a moving average with window equal to length. If center is True, then the 
+        two-sided moving average is computed. Otherwise, the moving average will be one-sided.
+
+        Args:
+            length (int): window length of the one-sided moving average.
+            center (bool): False (default) - one-sided MA. True - two-sided MA.
+
+        Returns:
+            fredpy series
+        '''
+
+        new_series = self.copy()
+
+        new_series.data = new_series.data.rolling(window=length,center=center).mean().dropna()
+        new_series.date_range = 'Range: '+str(new_series.data.index[0])[:10]+' to '+str(new_series.data.index[-1])[:10]
+        if center:
+            new_series._set_transformation('ma_centered')
+        else:
+            new_series._set_transformation('ma')
+
+        return new_series
+
+    
+    def minus(self,object2,join=None,fill_value=None):
+
+        '''Subtracts the data from object2 from the data from the current fredpy series.
+
+        Args:
+            object2 (int, float, numpy ndarray, or similar or fredpy series)
+            join (string):          If None (default), the dates of two series must be equal.
+                                        Otherwise, the dates are aligned: 'inner' (dates of both
+                                        series), 'outer' (dates of either series), 'left', or 'right'.
+            fill_value (float):     value of a series on aligned dates on which it has no observation.
+                                        Default: NaN
+
+        Note:
+            You are responsibile for making sure that adding the series makes sense.
+
+        Returns:
+            fredpy series
+        '''
+
+        return minus(self,object2,join,fill_value)
+
+
+    def pc(self,log=False,method='backward',annualized=False):
+
+        '''Computes the percentage change in the data from the preceding period.
+
+        Args:
+            log (bool):        If True, computes the percentage change as 100⋅log[x(t)/x(t-1)]. 
+                               If False (default), compute the percentage change as 100⋅[x(t)/x(t−1)−1].
+            method (string):   If ‘backward’ (default), compute percentage change from the previous period. 
+                               If ‘forward’, compute percentage change from current to subsequent period.
+            annualized (bool): If True (default), percentage change is annualized by multipying the simple 
+                               percentage change by the number of data observations per year. E.g., if the
+                               data are monthly, then the annualized percentage change is 12⋅100⋅log[x(t)/x(t−1)].
+
+        Returns:
+            fredpy series
+        '''
+
+        new_series = self.copy()
+        
+        T = len(self.data)
+        t = self.t
+
+        if log==True:
+            if method=='backward':
+                new_series.data = 100*np.log(self.data/self.data.shift(1)).dropna()
+            else:
+                new_series.data = 100*np.log(self.data.shift(-1)/self.data).dropna()
+        
+
+        else:
+            if method=='backward':
+                new_series.data = 100*(self.data/self.data.shift(1)-1).dropna()
+            else:
+                new_series.data = 100*(self.data.shift(-1)/self.data-1).dropna()
+
+        if annualized:
+            new_series.data = t*new_series.data
+
+        new_series._set_transformation('pc')
+        new_series.date_range = 'Range: '+str(new_series.data.index[0])[:10]+' to '+str(new_series.data.index[-1])[:10]
+
+        return new_series
+
+    
+    def per_capita(self,civ_pop = True):
+
+        '''Transforms the data into per capita terms (US) by dividing by a measure of the total population:
+
+        Args:
+            civ_pop (string): If civ_pop == True, use Civilian noninstitutional population defined as 
+                                persons 16 years of age and older (Default). Else, use the total US 
+                                population.
+
+        Returns:
+            fredpy series
+        '''
+
+        new_series = self.copy()
+
+        if civ_pop ==True:
+            population= series('CNP16OV').as_frequency(new_series.frequency_short)
+        else:
+            population= series('POP').as_frequency(new_series.frequency_short)
+    
+        new_series,population = window_equalize([new_series,population])
+
+        new_series.data = new_series.data/population.data
+
+        new_series.title = new_series.title+' Per Capita'
+        new_series.units = new_series.units+' Per Thousand People'
+        new_series.units_short = new_series.units_short+' Per Thousand People'
+        new_series.date_range = 'Range: '+str(new_series.data.index[0])[:10]+' to '+str(new_series.data.index[-1])[:10]
+
+        return new_series
+
+    
+    def plot(self,**kwargs):
+
+        self.data.plot(**kwargs)
+
+
+    def plus(self,object2,join=None,fill_value=None):
+
+        '''Adds the data from the current fredpy series to the data from object2.
+
+        Args:
+            object2 (int, float, numpy ndarray, or similar or fredpy series)
+            join (string):          If None (default), the dates of two series must be equal.
+                                        Otherwise, the dates are aligned: 'inner' (dates of both
+                                        series), 'outer' (dates of either series), 'left', or 'right'.
+            fill_value (float):     value of a series on aligned dates on which it has no observation.
+                                        Default: NaN
+
+        Note:
+            You are responsibile for making sure that adding the series makes sense.
+
+        Returns:
+            fredpy series
+        '''
+
+        return plus(self,object2,join,fill_value)
+
+    
+    def recent(self,N):
+
+        '''Restrict the data to the most recent N observations.
+
+        Args:
+            N (int): Number of periods to include in the data window.
+
+        Returns:
+            fredpy series
+        '''
+
+        new_series = self.copy()
+
+        new_series.data  =new_series.data.iloc[-N:]
+        new_series.date_range = 'Range: '+str(new_series.data.index[0])[:10]+' to '+str(new_series.data.index[-1])[:10]
+
+        return new_series
+
+    
+    def recessions(self,color='0.5',alpha = 0.5):
+        
+        '''Creates recession bars for plots. Should be used after a plot has been made but
+            before either (1) a new plot is created or (2) a show command is issued.
+
+        Args:
+            color (string): Color of the bars. Default: '0.5'
+            alpha (float):  Transparency of the recession bars. Must be between 0 and 1
+                            Default: 0.5
+
+        Returns:
+        '''
+
+        cycle_data = _get_cycle_data()
+
+        series_peaks = []
+        series_troughs = []
+
+        date_begin = self.data.index[0]
+        date_end = self.data.index[-1]
+
+        for k in range(len(cycle_data)):
+            
+            if cycle_data['peaks'].loc[k]<date_begin and date_begin < cycle_data['troughs'].loc[k]:
+                series_peaks.append(date_begin)
+                series_troughs.append(cycle_data['troughs'].loc[k])
+            
+                
+            elif date_begin < cycle_data['peaks'].loc[k] and date_end > cycle_data['troughs'].loc[k]:
+                series_peaks.append(cycle_data['peaks'].loc[k])
+                series_troughs.append(cycle_data['troughs'].loc[k])
+                
+            elif cycle_data['peaks'].loc[k]<date_end and cycle_data['troughs'].loc[k] > date_end:
+                series_peaks.append(cycle_data['peaks'].loc[k])
+                series_troughs.append(date_end)
+
+        import matplotlib.pyplot as plt
+
+        for k in range(len(series_peaks)):
+            plt.axvspan(series_peaks[k], series_troughs[k], edgecolor= color, facecolor=color, alpha=alpha)
+
+    
+    def refresh(self,lookback=None):
+
+        '''Updates the data with the latest values from FRED. The last_updated date of the series is
+        checked first and, only if it has changed, the observations starting lookback observations
+        before the last date in the data are downloaded and replace the corresponding values. The
+        descriptive attributes and observation_date are updated to the latest vintage.
+
+        Args:
+            lookback (int): Number of observations before the last date to download again in order to
+                            capture revisions. Default: the number of observations in three years, 
+                            3*t, or 12 if the frequency is unknown.
+
+        Returns:
+            bool: True if the data were updated. False if the series has not been updated on FRED.
+        '''
+
+        observation_date = _observation_date(None)
+
+        path = 'fred/series'
+
+        parameters = {'series_id':self.series_id,
+          'realtime_start':observation_date,
+          'realtime_end':observation_date,
+          'file_type':'json'
+         }
+
+        r = fred_api_request(api_key=api_key,path=path,parameters=parameters)
+        results = r.json()
+
+        if results['seriess'][0]['last_updated'] == self.last_updated:
+            return False
+
+        for attribute in ['title','units','frequency_short']:
+            if results['seriess'][0][attribute] != getattr(self,attribute):
+                raise ValueError('The '+attribute+' of the series differs from FRED. Only series that have not been transformed can be refreshed.')
+
+        if lookback is None:
+            if np.isnan(self.t):
+                lookback = 12
+            else:
+                lookback = 3*self.t
+
+        data = self.data
+
+        parameters = {'series_id':self.series_id,
+          'realtime_start':observation_date,
+          'realtime_end':observation_date,
+          'file_type':'json'
+         }
+
+        if len(data)>0:
+            start = data.index[-min(lookback,len(data))]
+            parameters['observation_start'] = start.strftime('%Y-%m-%d')
+            data = data.loc[data.index<start]
+
+        new_data = pd.concat([data,_parse_observations(_download_observations(parameters))])
+
+        # The one-sided HP filter continues from its last state only if no filtered observation was
+        # revised. Only the observations downloaded again can differ.
+        state = self._filter_state
+        if state is not None:
+            n = state['n']
+            if len(new_data)<n or not new_data.iloc[len(data):n].equals(self.data.iloc[len(data):n]):
+                state = None
+
+        self.data = new_data
+        self._filter_state = state
+        self.date_range = 'Range: '+str(self.data.index[0])[:10]+' to '+str(self.data.index[-1])[:10]
+        self._set_metadata(self.series_id,observation_date,results)
+
+        if self._lazy_date is not None:
+            self._lazy_date = observation_date
+
+        return True
+
+
+    def times(self,object2,join=None,fill_value=None):
+
+        '''Multiplies the data from the current fredpy series with the data from object2.
+
+        Args:
+            object2 (int, float, numpy ndarray, or similar or fredpy series)
+            join (string):          If None (default), the dates of two series must be equal.
+                                        Otherwise, the dates are aligned: 'inner' (dates of both
+                                        series), 'outer' (dates of either series), 'left', or 'right'.
+            fill_value (float):     value of a series on aligned dates on which it has no observation.
+                                        Default: NaN
+
+        Note:
+            You are responsibile for making sure that adding the series makes sense.
+
+        Returns:
+            fredpy series
+        '''
+
+        return times(self,object2,join,fill_value)
+
+
+    def to_feather(self,path,compression='uncompressed'):
+
+        '''Saves the series to a Feather (Arrow IPC) file that can be memory-mapped. Load with
+        fredpy.read_feather(). Requires the pyarrow package.
+
+        Args:
+            path (string):          location of the file.
+            compression (string):   'uncompressed', 'lz4', or 'zstd'. Default: 'uncompressed'
+
+        Returns:
+            None
+        '''
+
+        write_feather([self],path,compression=compression)
+
+
+    def to_parquet(self,path,compression='snappy'):
+
+        '''Saves the series to a Parquet file. The data are stored in columns and the other
+        attributes are stored in the metadata of the file. Load with fredpy.read_parquet(). 
+        Requires the pyarrow package.
+
+        Args:
+            path (string):          location of the file.
+            compression (string):   compression codec. Default: 'snappy'
+
+        Returns:
+            None
+        '''
+
+        write_parquet([self],path,compression=compression)
+
+
+    def window(self,start_end):
+
+        '''Restricts the data to a specified date window.
+
+        Args:
+
+            start_end (list):   is an ordered pair: start_end = [start, end]
+
+                                    start is the date of the minimum date
+                                    end is the date of the maximum date
+        
+                                both are strings in either 'yyyy-mm-dd' or 'mm-dd-yyyy' format
+
+        Returns:
+            fredpy series
+        '''
+
+        new_series = self.copy()
+
+        new_series.data = new_series.data.loc[start_end[0]:start_end[1]]
+
+        if len(new_series.data)>0:
+            new_series.date_range = 'Range: '+str(new_series.data.index[0])[:10]+' to '+str(new_series.data.index[-1])[:10]
+        else:
+            new_series.date_range = 'Range: Null'
+
+
+        return new_series
+
+######################################################################################################
+# Lazy evaluation of series transformations
+
+class lazy_series:
+
+    '''Defines a class for chaining transformations of a series that are evaluated only when the
+    result is used. Create with series.lazy().'''
+
+    def __init__(self,source,steps=()):
+
+        '''Initializes an instance of the lazy_series class.
+
+        Args:
+            source (fredpy series): series to be transformed.
+            steps (tuple):          transformations to apply in order. Default: no transformations.
+
+        Returns:
+            None
+        '''
+
+        self._source = source
+        self._steps = tuple(steps)
+        self._result = None
+
+
+    def __getattr__(self,name):
+
+        # Only called for attributes that have not been set. Evaluates the transformations and
+        # returns the attribute of the result, e.g., data or date_range.
+
+        if name.startswith('_'):
+            raise AttributeError(repr(type(self).__name__)+' object has no attribute '+repr(name))
+
+        return getattr(self.collect(),name)
+
+
+    def _evaluate(self,values,dates,metadata,steps):
+
+        # Applies steps to values (float array) with dates (DatetimeIndex) and updates metadata 
+        # (dict) like the corresponding series methods. Returns the values, the dates, and True if 
+        # missing values were removed after a shift or moving average. Elementwise operations are
+        # done in place once values is owned, i.e., not a view of the data of the source.
+
+        owned = False
+        dropped = False
+
+        for step in steps:
+
+            name = step[0]
+
+            if name == 'log':
+
+                if owned:
+                    np.log(values,out=values)
+                else:
+                    values = np.log(values)
+                    owned = True
+
+                _transform_metadata(metadata,'log')
+
+            elif name in ['pc','apc']:
+
+                log, method = step[1], step[2]
+
+                if name == 'pc':
+                    k = 1
+                else:
+                    k = metadata['t']
+
+                n = len(values)
+                values = values[k:]/values[:max(n-k,0)]
+
+                if method=='backward':
+                    dates = dates[k:]
+                else:
+                    dates = dates[:max(n-k,0)]
+
+                if log==True:
+                    np.log(values,out=values)
+                else:
+                    values-=1
+
+                values*=100
+                owned = True
+
+                values, dates, removed = self._drop_nan(values,dates)
+                dropped = dropped or removed
+
+                if name == 'pc' and step[3]:
+                    values*=metadata['t']
+
+                _transform_metadata(metadata,name)
+
+            elif name == 'ma':
+
+                length, center = step[1], step[2]
+                back, ahead = self._lags(step,metadata)
+
+                n = len(values)
+                values = pd.Series(values).rolling(window=length,center=center).mean().to_numpy()[back:max(back,n-ahead)]
+                dates = dates[back:max(back,n-ahead)]
+
+                # The array returned by pandas is read-only under copy-on-write
+                owned = values.flags.writeable
+
+                values, dates, removed = self._drop_nan(values,dates)
+                dropped = dropped or removed
+
+                if center:
+                    _transform_metadata(metadata,'ma_centered')
+                else:
+                    _transform_metadata(metadata,'ma')
+
+            elif name == 'drop_nan':
+
+                values, dates, removed = self._drop_nan(values,dates)
+                dropped = dropped or removed
+
+            elif name == 'window':
+
+                positions = dates.slice_indexer(step[1][0],step[1][1])
+                values = values[positions]
+                dates = dates[positions]
+
+            elif name == 'recent':
+
+                values = values[-step[1]:]
+                dates = dates[-step[1]:]
+
+        return values, dates, dropped
+
+
+    @staticmethod
+    def _drop_nan(values,dates):
+
+        # Removes missing values. Returns the values, the dates, and True if any were removed.
+
+        missing = np.isnan(values)
+
+        if missing.any():
+            return values[~missing], dates[~missing], True
+
+        return values, dates, False
+
+
+    @staticmethod
+    def _lags(step,metadata):
+
+        # Returns the numbers of preceding and following observations used to compute each value 
+        # of a transformation.
+
+        name = step[0]
+
+        if name in ['pc','apc']:
+
+            if name == 'pc':
+                k = 1
+            else:
+                k = metadata['t']
+
+            if step[2]=='backward':
+                return k, 0
+            else:
+                return 0, k
+
+        if name == 'ma':
+
+            length, center = step[1], step[2]
+
+            if center:
+                return length//2, length-1-length//2
+            else:
+                return length-1, 0
+
+        return 0, 0
+
+
+    def _step(self,*step):
+
+        # Returns a new lazy_series with step appended to the transformations.
+
+        return lazy_series(self._source,self._steps+(step,))
+
+
+    def apc(self,log=False,method='backward'):
+
+        '''Computes the percentage change in the data over one year when evaluated. See series.apc().
+
+        Returns:
+            fredpy lazy_series
+        '''
+
+        return self._step('apc',log,method)
+
+
+    def collect(self):
+
+        '''Evaluates the transformations. Window and recent restrictions that follow the other
+        transformations are applied to the data of the source first, extended by the number of 
+        observations that the transformations use, unless missing values are encountered.
+
+        Args:
+
+        Returns:
+            fredpy series
+        '''
+
+        if self._result is not None:
+            return self._result
+
+        source = self._source
+        metadata = {attribute:getattr(source,attribute) for attribute in ['t','title','units','units_short']}
+
+        values = source.data.to_numpy(dtype=float)
+        dates = source.data.index
+        steps = list(self._steps)
+
+        # Restrictions at the start are applied as usual
+        first = 0
+        while first<len(steps) and steps[first][0] in ['window','recent']:
+            first+=1
+
+        values, dates, dropped = self._evaluate(values,dates,metadata,steps[:first])
+
+        # Restrictions at the end are applied to the positions that the result would have if no 
+        # missing values were removed
+        last = len(steps)
+        while last>first and steps[last-1][0] in ['window','recent']:
+            last-=1
+
+        body = steps[first:last]
+        restrictions = steps[last:]
+
+        result = None
+
+        if len(body)>0 and len(restrictions)>0 and not any(step[0] in ['window','recent'] for step in body) and not np.isnan(values).any():
+
+            back, ahead = 0, 0
+            for step in body:
+                lags = self._lags(step,metadata)
+                back+=lags[0]
+                ahead+=lags[1]
+
+            # Without missing values, the result has a value for each position from back to 
+            # n-ahead of the data, and value i uses positions i-back to i+ahead
+            first, last = back, max(back,len(values)-ahead)
+
+            for step in restrictions:
+                if step[0] == 'window':
+                    positions = dates.slice_indexer(step[1][0],step[1][1])
+                    first, last = max(first,positions.start), min(last,positions.stop)
+                elif step[1]>0:
+                    first = max(first,last-step[1])
+
+            last = max(first,last)
+
+            pushed_metadata = dict(metadata)
+            pushed = self._evaluate(values[first-back:last+ahead],dates[first-back:last+ahead],pushed_metadata,body)
+
+            # If missing values were removed, the positions of the result differ
+            if not pushed[2]:
+                result = pushed
+                metadata = pushed_metadata
+
+        if result is None:
+            result = self._evaluate(values,dates,metadata,body+restrictions)
+
+        values, dates = result[0], result[1]
+
+        new_series = source.copy()
+
+        for attribute, value in metadata.items():
+            setattr(new_series,attribute,value)
+
+        new_series.data = pd.Series(values,index=dates,name=source.data.name)
+
+        if len(dates)>0:
+            new_series.date_range = 'Range: '+str(dates[0])[:10]+' to '+str(dates[-1])[:10]
+        else:
+            new_series.date_range = 'Range: Null'
+
+        self._result = new_series
+
+        return new_series
+
+
+    def drop_nan(self):
+
+        '''Removes missing (NaN) values when evaluated.
+
+        Returns:
+            fredpy lazy_series
+        '''
+
+        return self._step('drop_nan')
+
+
+    def log(self):
+
+        '''Computes the natural log of the data when evaluated.
+
+        Returns:
+            fredpy lazy_series
+        '''
+
+        return self._step('log')
+
+
+    def ma(self,length,center=False):
+
+        '''Computes a moving average with window equal to length when evaluated. See series.ma().
+
+        Returns:
+            fredpy lazy_series
+        '''
+
+        return self._step('ma',length,center)
+
+
+    def pc(self,log=False,method='backward',annualized=False):
+
+        '''Computes the percentage change in the data from the preceding period when evaluated. See
+        series.pc().
+
+        Returns:
+            fredpy lazy_series
+        '''
+
+        return self._step('pc',log,method,annualized)
+
+
+    def recent(self,N):
+
+        '''Restrict the data to the most recent N observations when evaluated.
+
+        Returns:
+            fredpy lazy_series
+        '''
+
+        return self._step('recent',N)
+
+
+    def window(self,start_end):
+
+        '''Restricts the data to a specified date window when evaluated. See series.window().
+
+        Returns:
+            fredpy lazy_series
+        '''
+
+        return self._step('window',list(start_end))
+
+
+######################################################################################################
+# Panel of series
+
+class panel:
+
+    '''Defines a class for storing and transforming a collection of series with a common date index.'''
+
+    def __init__(self,series_list=None):
+
+        '''Initializes an instance of the panel class. The data of the series are stored in one 2-D
+        array with a column for each series, and the transformation methods compute all of the 
+        columns at once.
+
+        Args:
+            series_list (list or dict): fredpy series. If a dict, e.g., the result of 
+                                            fredpy.fetch_many(), the keys are used as the names of
+                                            the columns, otherwise the series IDs are used. The
+                                            series are aligned on the union of their dates with
+                                            NaN for missing observations. If series_list equals 
+                                            None, an empty panel is created.
+
+        Returns:
+            None
+
+        Attributes:
+            data:       (Pandas DataFrame) data values with dates as index and a column for each series.
+            date_range: (string) specifies the dates of the first and last observations.
+            metadata:   (dict) descriptive attributes of each series (title, units, t, etc.) with the 
+                            names of the columns as keys.
+        '''
+
+        if series_list is None:
+            series_list = []
+
+        names, series_list = _series_names(series_list)
+        values, dates = _aligned_values([s.data.to_numpy(dtype=float) for s in series_list],[s.data.index.values for s in series_list])
+
+        self.metadata = {name:{attribute:getattr(s,attribute) for attribute in _metadata_attributes} for name, s in zip(names,series_list)}
+        self._set_data(values,dates,names)
+
+
+    def __getitem__(self,name):
+
+        '''Returns the series in column name. Missing values before the first and after the last 
+        observation of the series are removed. Use drop_nan() to remove the other missing values.
+
+        Args:
+            name (string):  name of a column.
+
+        Returns:
+            fredpy series
+        '''
+
+        data = self.data[name]
+        data = data.loc[data.first_valid_index():data.last_valid_index()].rename('value')
+
+        return _new_series(data,_series_metadata(tuple(self.metadata[name][attribute] for attribute in _metadata_attributes)))
+
+
+    def __len__(self):
+
+        return len(self.metadata)
+
+
+    def _filter_columns(self,function,minimum):
+
+        # Returns function applied to the data, e.g., a filter whose result for each column depends
+        # on the number of observations. The columns are grouped by the range of rows between their
+        # first and last observations, and function is applied to the rows in the range of each 
+        # group of at least minimum rows. Other values of the result are missing.
+
+        x = self.data.to_numpy()
+        result = np.full(x.shape,np.nan)
+
+        observed = ~np.isnan(x)
+        first = observed.argmax(axis=0)
+        last = len(x)-observed[::-1].argmax(axis=0)
+
+        groups = {}
+
+        for j in np.flatnonzero(observed.any(axis=0)):
+            groups.setdefault((first[j],last[j]),[]).append(j)
+
+        for (start,end), columns in groups.items():
+            if end-start>=minimum:
+                result[start:end,columns] = function(x[start:end,columns])
+
+        return result
+
+
+    def _set_data(self,values,dates,names=None,dropna=False):
+
+        # Sets data from a 2-D array with a row for each date in dates (DatetimeIndex). Uses the 
+        # current columns if names is None. If dropna is True, rows in which all values are missing
+        # are removed like the missing values removed by the corresponding series methods.
+
+        if names is None:
+            names = self.data.columns
+
+        if dropna:
+            keep = ~np.isnan(values).all(axis=1)
+            if not keep.all():
+                values = values[keep]
+                dates = dates[keep]
+
+        self.data = pd.DataFrame(values,index=dates,columns=pd.Index(names),copy=False)
+
+        if len(dates)>0:
+            self.date_range = 'Range: '+str(dates[0])[:10]+' to '+str(dates[-1])[:10]
+        else:
+            self.date_range = 'Range: Null'
+
+
+    def _t(self):
+
+        # Returns the number of observations per year of the series. All series must have the same
+        # frequency.
+
+        t = set(metadata['t'] for metadata in self.metadata.values())
+
+        if len(t) != 1:
+            raise ValueError('All series in the panel must have the same frequency. Use as_frequency() first.')
+
+        return t.pop()
+
+
+    def apc(self,log=False,method='backward'):
+
+        '''Computes the percentage change in the data over one year. See series.apc().
+
+        Args:
+            log (bool):         If True, computes the percentage change as 100⋅log[x(t)/x(t-k)], where k is
+                                    the number of observations per year.
+                                If False (default), compute the percentage change as 100⋅[x(t)/x(k−1)−1].
+            method (string):    If ‘backward’ (default), compute percentage change from the previous period. 
+                                If ‘forward’, compute percentage change from current to subsequent period.
+
+        Returns:
+            fredpy panel
+        '''
 
-        new_series_trend.data = self.data.shift(1).dropna()
-        new_series_trend.title = self.title+' - trend (first difference filtered)'
-        new_series_trend.date_range = 'Range: '+str(new_series_trend.data.index[0])[:10]+' to '+str(new_series_trend.data.index[-1])[:10]
+        new_panel = self.copy()
 
-        return new_series_cycle,new_series_trend
+        k = self._t()
+        x = self.data.to_numpy()
 
-    
-    def divide(self,object2):
+        with np.errstate(divide='ignore',invalid='ignore'):
+            if log==True:
+                values = 100*np.log(x[k:]/x[:-k])
+            else:
+                values = 100*(x[k:]/x[:-k]-1)
 
-        '''Divides the data from the current fredpy series by the data from object2.
+        if method=='backward':
+            new_panel._set_data(values,self.data.index[k:],dropna=True)
+        else:
+            new_panel._set_data(values,self.data.index[:-k],dropna=True)
 
-        Args:
-            object2 (int, float, numpy ndarray, or similar or fredpy series)
+        for metadata in new_panel.metadata.values():
+            _transform_metadata(metadata,'apc')
 
-        Note:
-            You are responsibile for making sure that dividing the series makes sense.
+        return new_panel
+
+
+    def as_frequency(self,freq=None,method='mean'):
+
+        '''Convert the series in the panel to a lower frequency. See series.as_frequency().
 
+        Args:
+            freq (string):      Abbreviation of desired frequency: 'D','W','M','Q','A'
+            method (string):    How to resample the data: 'first', 'last', 'mean' (default), 'median',
+                                    'min', 'max', 'sum'
         Returns:
-            fredpy series
+            fredpy panel
         '''
 
-        return divide(self,object2)
+        new_panel = self.copy()
 
-    def drop_nan(self):
+        if freq not in _frequencies:
+            raise ValueError("freq must be 'D', 'W', 'M', 'Q', or 'A'")
 
-        '''Removes missing (NaN) values.
+        t, frequency, pandas_frequency = _frequencies[freq]
+
+        if method not in ['first','last','mean','median','min','max','sum']:
+            raise ValueError("method must be 'first', 'last', 'mean', 'median', 'min', 'max', or 'sum'")
+
+        if any(metadata['t']<t for metadata in self.metadata.values()):
+            warnings.warn('Warning: You are converting series to a higher frequency and this method may not behave as you expect.')
+
+        data = getattr(self.data.resample(pandas_frequency),method)()
+        new_panel._set_data(data.to_numpy(),data.index)
+
+        for metadata in new_panel.metadata.values():
+            metadata['t'] = t
+            metadata['frequency_short'] = freq
+            metadata['frequency'] = frequency
+
+        return new_panel
+
+
+    def bp_filter(self,low=6,high=32,K=12):
+
+        '''Computes the bandpass (Baxter-King) filter of the data of all of the series. Returns two
+        fredpy.panel instances containing the cyclical and trend components of the data:
+
+            new_panel_cycle,new_panel_trend
+
+        The filter weights are computed once and applied to all of the columns at once. See 
+        series.bp_filter().
 
         Args:
+            low (int):  Minimum period for oscillations. Select 24 for monthly data, 6 for quarterly 
+                        data (default), and 3 for annual data.
+            high (int): Maximum period for oscillations.  Select 84 for monthly data, 32 for quarterly 
+                        data (default), and 8 for annual data.
+            K (int):    Lead-lag length of the filter. Select, 84 for monthly data, 12 for for quarterly
+                        data (default), and 1.5 for annual data.
 
         Returns:
-            fredpy series
+            two fredpy.panel instances
         '''
 
-        new_series = self.copy()
-        
-        new_series.data = new_series.data.dropna()
-        new_series.date_range = 'Range: '+str(new_series.data.index[0])[:10]+' to '+str(new_series.data.index[-1])[:10]
+        new_panel_cycle = self.copy()
+        new_panel_trend = self.copy()
 
-        return new_series
+        x = self.data.to_numpy()
+        cycle = _bk_filter(x,low,high,K)
+        dates = self.data.index[K:len(x)-K]
 
+        new_panel_cycle._set_data(cycle,dates)
+        new_panel_trend._set_data(x[K:len(x)-K]-cycle,dates)
 
-    def hp_filter(self,lamb=1600):
+        for metadata in new_panel_cycle.metadata.values():
+            metadata['units'] = 'Deviation relative to trend'
+            metadata['units_short'] = 'Dev. rel. to trend'
+            metadata['title'] = metadata['title']+' - deviation relative to trend (bandpass filtered)'
 
-        '''Computes the Hodrick-Prescott (HP) filter of the data. Returns two fredpy.series
-        instances containing the cyclical and trend components of the data:
+        for metadata in new_panel_trend.metadata.values():
+            metadata['title'] = metadata['title']+' - trend (bandpass filtered)'
 
-            new_series_cycle,new_series_trend
+        return new_panel_cycle,new_panel_trend
+
+
+    def cf_filter(self,low=6,high=32):
+
+        '''Computes the Christiano-Fitzgerald (CF) filter of the data of all of the series. Returns
+        two fredpy.panel instances containing the cyclical and trend components of the data:
+
+            new_panel_cycle,new_panel_trend
+
+        The filter weights are computed once for each distinct number of observations and cached, 
+        and series of the same length are filtered at once. Series with missing values between 
+        their first and last observations have missing results. See series.cf_filter().
 
         Args:
-            lamb (int): The Hodrick-Prescott smoothing parameter. Select 129600 for monthly data,
-                        1600 for quarterly data (default), 6.25 for annual data, or 104976000000
-                        for daily data.
-                        
-                        In general, set lambda to: 1600*[number of observations per quarter]**4
-            
+            low (int):  Minimum period for oscillations. Default: 6
+            high (int): Maximum period for oscillations. Default: 32
+
         Returns:
-            two fredpy.series instances
+            two fredpy.panel instances
         '''
 
-        new_series_cycle = self.copy()
-        new_series_trend = self.copy()
+        new_panel_cycle = self.copy()
+        new_panel_trend = self.copy()
 
-        if lamb==1600 and self.t !=4:
-            print('Warning: data frequency is not quarterly!')
-        elif lamb==129600 and self.t !=12:
-            print('Warning: data frequency is not monthly!')
-        elif lamb==6.25 and self.t !=1:
-            print('Warning: data frequency is not annual!')
-            
-        cycle, trend = tsa.filters.hpfilter(self.data,lamb=lamb)
+        x = self.data.to_numpy()
+        cycle = self._filter_columns(lambda values: _cf_filter(values,low,high),2)
 
-        new_series_cycle.data = cycle
-        new_series_cycle.units = 'Deviation relative to trend'
-        new_series_cycle.units_short = 'Dev. rel. to trend'
-        new_series_cycle.title = self.title+' - deviation relative to trend (HP filtered)'
+        new_panel_cycle._set_data(cycle,self.data.index)
+        new_panel_trend._set_data(x-cycle,self.data.index)
 
-        new_series_trend.title = self.title+' - trend (HP filtered)'
-        new_series_trend.data = trend
+        for metadata in new_panel_cycle.metadata.values():
+            metadata['units'] = 'Deviation relative to trend'
+            metadata['units_short'] = 'Dev. rel. to trend'
+            metadata['title'] = metadata['title']+' - deviation relative to trend (CF filtered)'
 
-        return new_series_cycle,new_series_trend
+        for metadata in new_panel_trend.metadata.values():
+            metadata['title'] = metadata['title']+' - trend (CF filtered)'
 
-    
-    def linear_filter(self):
+        return new_panel_cycle,new_panel_trend
 
-        '''Computes a simple linear filter of the data using OLS. Returns two fredpy.series
-        instances containing the cyclical and trend components of the data:
 
-            new_series_cycle,new_series_trend
+    def copy(self):
+
+        '''Returns a copy of a panel object.
 
         Args:
 
         Returns:
-            two fredpy.series instances
+            fredpy panel
         '''
 
-        new_series_cycle = self.copy()
-        new_series_trend = self.copy()
+        new_panel = panel()
 
-        y = self.data
-        time = np.arange(len(self.data))
-        x = np.column_stack([time])
-        x = sm.add_constant(x)
-        model = sm.OLS(y,x)
-        result= model.fit()
-        pred  = result.predict(x)
-        
-        cycle= y-pred
-        trend= pd.Series(pred,index=self.data.index)
+        new_panel.data = self.data
+        new_panel.date_range = self.date_range
+        new_panel.metadata = {name:dict(metadata) for name, metadata in self.metadata.items()}
 
-        new_series_cycle.data = cycle
-        new_series_cycle.units = 'Deviation relative to trend'
-        new_series_cycle.units_short = 'Dev. rel. to trend'
-        new_series_cycle.title = self.title+' - deviation relative to trend (linearly filtered via OLS)'
+        return new_panel
 
-        new_series_trend.title = self.title+' - trend (linearly filtered via OLS)'
-        new_series_trend.data = trend
 
-        return new_series_cycle,new_series_trend
+    def hp_filter(self,lamb=1600):
 
-    
-    def log(self):
-        
-        '''Computes the natural log of the data
+        '''Computes the Hodrick-Prescott (HP) filter of the data of all of the series. Returns two
+        fredpy.panel instances containing the cyclical and trend components of the data:
+
+            new_panel_cycle,new_panel_trend
+
+        The HP filter system is factored once for each distinct number of observations and the
+        factors are cached, so series of the same length are filtered in one solve. Series with
+        missing values between their first and last observations have missing results.
 
         Args:
+            lamb (int): The Hodrick-Prescott smoothing parameter. Select 129600 for monthly data,
+                        1600 for quarterly data (default), 6.25 for annual data, or 104976000000
+                        for daily data.
 
         Returns:
-            fredpy series
+            two fredpy.panel instances
         '''
 
-        new_series = self.copy()
+        new_panel_cycle = self.copy()
+        new_panel_trend = self.copy()
 
-        new_series.data = np.log(new_series.data)
-        new_series.units = 'Log '+new_series.units
-        new_series.units_short = 'Log '+new_series.units_short
-        new_series.title = 'Log '+new_series.title
+        x = self.data.to_numpy()
+        trend = self._filter_columns(lambda values: _hp_trend(values,lamb),3)
 
-        return new_series
+        new_panel_trend._set_data(trend,self.data.index)
+        new_panel_cycle._set_data(x-trend,self.data.index)
 
-    def ma(self,length,center=False):
+        for metadata in new_panel_cycle.metadata.values():
+            metadata['units'] = 'Deviation relative to trend'
+            metadata['units_short'] = 'Dev. rel. to trend'
+            metadata['title'] = metadata['title']+' - deviation relative to trend (HP filtered)'
 
-        '''Computes a moving average with window equal to length. If center is True, then the 
-        two-sided moving average is computed. Otherwise, the moving average will be one-sided.
+        for metadata in new_panel_trend.metadata.values():
+            metadata['title'] = metadata['title']+' - trend (HP filtered)'
+
+        return new_panel_cycle,new_panel_trend
+
+
+    def log(self):
+
+        '''Computes the natural log of the data.
 
         Args:
-            length (int): window length of the one-sided moving average.
-            center (bool): False (default) - one-sided MA. True - two-sided MA.
 
         Returns:
-            fredpy series
+            fredpy panel
         '''
 
-        new_series = self.copy()
+        new_panel = self.copy()
 
-        new_series.data = new_series.data.rolling(window=length,center=center).mean().dropna()
-        new_series.date_range = 'Range: '+str(new_series.data.index[0])[:10]+' to '+str(new_series.data.index[-1])[:10]
-        if center:
-            new_series.title = self.title+' (: one-sided moving average)'
-        else:
-            new_series.title = self.title+' (: two-sided moving average)'
+        with np.errstate(divide='ignore',invalid='ignore'):
+            new_panel._set_data(np.log(self.data.to_numpy()),self.data.index)
 
-        return new_series
+        for metadata in new_panel.metadata.values():
+            _transform_metadata(metadata,'log')
 
-    
-    def minus(self,object2):
+        return new_panel
 
-        '''Subtracts the data from object2 from the data from the current fredpy series.
 
-        Args:
-            object2 (int, float, numpy ndarray, or similar or fredpy series)
+    def ma(self,length,center=False):
 
-        Note:
-            You are responsibile for making sure that adding the series makes sense.
+        '''Computes a moving average with window equal to length. See series.ma().
+
+        Args:
+            length (int): window length of the one-sided moving average.
+            center (bool): False (default) - one-sided MA. True - two-sided MA.
 
         Returns:
-            fredpy series
+            fredpy panel
         '''
 
-        return minus(self,object2)
+        new_panel = self.copy()
+
+        data = self.data.rolling(window=length,center=center).mean()
+        new_panel._set_data(data.to_numpy(),data.index,dropna=True)
+
+        for metadata in new_panel.metadata.values():
+            if center:
+                _transform_metadata(metadata,'ma_centered')
+            else:
+                _transform_metadata(metadata,'ma')
+
+        return new_panel
 
 
     def pc(self,log=False,method='backward',annualized=False):
 
-        '''Computes the percentage change in the data from the preceding period.
+        '''Computes the percentage change in the data from the preceding period. See series.pc().
 
         Args:
             log (bool):        If True, computes the percentage change as 100⋅log[x(t)/x(t-1)]. 
                                If False (default), compute the percentage change as 100⋅[x(t)/x(t−1)−1].
             method (string):   If ‘backward’ (default), compute percentage change from the previous period. 
                                If ‘forward’, compute percentage change from current to subsequent period.
-            annualized (bool): If True (default), percentage change is annualized by multipying the simple 
-                               percentage change by the number of data observations per year. E.g., if the
-                               data are monthly, then the annualized percentage change is 12⋅100⋅log[x(t)/x(t−1)].
+            annualized (bool): If True, percentage change is annualized by multipying the simple 
+                               percentage change by the number of data observations per year of 
+                               each series. Default: False
 
         Returns:
-            fredpy series
+            fredpy panel
         '''
 
-        new_series = self.copy()
-        
-        T = len(self.data)
-        t = self.t
+        new_panel = self.copy()
 
-        if log==True:
-            if method=='backward':
-                new_series.data = 100*np.log(self.data/self.data.shift(1)).dropna()
-            else:
-                new_series.data = 100*np.log(self.data.shift(-1)/self.data).dropna()
-        
+        x = self.data.to_numpy()
 
-        else:
-            if method=='backward':
-                new_series.data = 100*(self.data/self.data.shift(1)-1).dropna()
+        with np.errstate(divide='ignore',invalid='ignore'):
+            if log==True:
+                values = 100*np.log(x[1:]/x[:-1])
             else:
-                new_series.data = 100*(self.data.shift(-1)/self.data-1).dropna()
+                values = 100*(x[1:]/x[:-1]-1)
 
         if annualized:
-            new_series.data = t*new_series.data
+            values = values*np.array([metadata['t'] for metadata in self.metadata.values()],dtype=float)
 
-        new_series.units = 'Percent'
-        new_series.units_short = '%'
-        new_series.title = 'Percentage Change in '+self.title
-        new_series.date_range = 'Range: '+str(new_series.data.index[0])[:10]+' to '+str(new_series.data.index[-1])[:10]
+        if method=='backward':
+            new_panel._set_data(values,self.data.index[1:],dropna=True)
+        else:
+            new_panel._set_data(values,self.data.index[:-1],dropna=True)
 
-        return new_series
+        for metadata in new_panel.metadata.values():
+            _transform_metadata(metadata,'pc')
 
-    
-    def per_capita(self,civ_pop = True):
+        return new_panel
 
-        '''Transforms the data into per capita terms (US) by dividing by a measure of the total population:
+
+    def recent(self,N):
+
+        '''Restrict the data to the most recent N observations.
 
         Args:
-            civ_pop (string): If civ_pop == True, use Civilian noninstitutional population defined as 
-                                persons 16 years of age and older (Default). Else, use the total US 
-                                population.
+            N (int): Number of periods to include in the data window.
 
         Returns:
-            fredpy series
+            fredpy panel
         '''
 
-        new_series = self.copy()
+        new_panel = self.copy()
 
-        if civ_pop ==True:
-            population= series('CNP16OV').as_frequency(new_series.frequency_short)
-        else:
-            population= series('POP').as_frequency(new_series.frequency_short)
-    
-        new_series,population = window_equalize([new_series,population])
+        new_panel._set_data(self.data.to_numpy()[-N:],self.data.index[-N:])
 
-        new_series.data = new_series.data/population.data
+        return new_panel
+
+
+    def to_dict(self):
+
+        '''Returns the series in the panel.
+
+        Args:
+
+        Returns:
+            dict of fredpy series with the names of the columns as keys
+        '''
+
+        return {name:self[name] for name in self.metadata}
+
+
+    def window(self,start_end):
+
+        '''Restricts the data to a specified date window.
+
+        Args:
+
+            start_end (list):   is an ordered pair: start_end = [start, end]
+
+                                    start is the date of the minimum date
+                                    end is the date of the maximum date
+        
+                                both are strings in either 'yyyy-mm-dd' or 'mm-dd-yyyy' format
+
+        Returns:
+            fredpy panel
+        '''
+
+        new_panel = self.copy()
+
+        data = self.data.loc[start_end[0]:start_end[1]]
+        new_panel._set_data(data.to_numpy(),data.index)
+
+        return new_panel
+
+
+######################################################################################################
+# Store for the vintages of a series
+
+class vintage_store:
+
+    '''Defines a class for storing all vintages of a FRED series as real-time periods.'''
+
+    def __init__(self,series_id=None,start=None,end=None):
+
+        '''Initializes an instance of the vintage_store class. Each value of the series is stored 
+        once with the first and last vintage dates at which it was observed (a real-time period),
+        so a vintage that revises a few observations adds only a few values to the store.
+
+        Args:
+            series_id (string): unique FRED series ID. If series_id equals None, an empty store is 
+                                    created.
+            start (string):     YYYY-MM-DD formatted date string. First vintage date. Default: 
+                                    '1776-07-04', the earliest date in ALFRED.
+            end (string):       YYYY-MM-DD formatted date string. Last vintage date. Default: 
+                                    '9999-12-31', i.e., including the latest vintage.
+
+        Returns:
+            None
+
+        Attributes:
+            date:           (Numpy ndarray) observation date of each real-time period.
+            metadata:       (dict) descriptive attributes of the latest vintage of the series.
+            realtime_end:   (Numpy ndarray) last vintage date of each real-time period.
+            realtime_start: (Numpy ndarray) first vintage date of each real-time period.
+            value:          (Numpy ndarray) data value of each real-time period.
+        '''
+
+        if type(series_id) == str:
+
+            if start is None:
+                start = '1776-07-04'
+
+            if end is None:
+                end = '9999-12-31'
+
+            latest = series(series_id,lazy=True)
+            self.metadata = {name:getattr(latest,name) for name in _metadata_attributes}
+
+            parameters = {'series_id':series_id,
+              'realtime_start':start,
+              'realtime_end':end,
+              'file_type':'json'
+             }
 
-        new_series.title = new_series.title+' Per Capita'
-        new_series.units = new_series.units+' Per Thousand People'
-        new_series.units_short = new_series.units_short+' Per Thousand People'
-        new_series.date_range = 'Range: '+str(new_series.data.index[0])[:10]+' to '+str(new_series.data.index[-1])[:10]
+            arrays = _download_observations(parameters,realtime=True)
 
-        return new_series
+        else:
 
-    
-    def plot(self,**kwargs):
+            self.metadata = {name:getattr(series(),name) for name in _metadata_attributes}
+            arrays = _observation_arrays([],realtime=True)
 
-        self.data.plot(**kwargs)
+        self.date = arrays['date']
+        self.realtime_end = arrays['realtime_end']
+        self.realtime_start = arrays['realtime_start']
+        self.value = arrays['value']
 
 
-    def plus(self,object2):
+    def as_of(self,observation_date=None):
 
-        '''Adds the data from the current fredpy series to the data from object2.
+        '''Reconstructs the series as observed on a vintage date. Takes one pass over the real-time
+        periods.
 
         Args:
-            object2 (int, float, numpy ndarray, or similar or fredpy series)
-
-        Note:
-            You are responsibile for making sure that adding the series makes sense.
+            observation_date (string):  YYYY-MM-DD formatted date string. If only YYYY string is 
+                                            provided, month and day are assumed to be December 31.
+                                            Default: today.
 
         Returns:
             fredpy series
         '''
 
-        return plus(self,object2)
+        observation_date = _observation_date(observation_date)
+        vintage = np.datetime64(observation_date,'D')
 
-    
-    def recent(self,N):
+        # The periods are sorted by date, and at most one period of each date spans the vintage
+        selected = (self.realtime_start<=vintage) & (vintage<=self.realtime_end)
 
-        '''Restrict the data to the most recent N observations.
+        if not selected.any():
+            raise ValueError('No data in the store were observed on '+observation_date+'.')
+
+        metadata = dict(self.metadata,observation_date=datetime.datetime.strptime(observation_date,"%Y-%m-%d").strftime('%B %d, %Y'))
+        data = _parse_observations({'date':self.date[selected],'value':self.value[selected]})
+
+        return _new_series(data,_series_metadata(tuple(metadata[name] for name in _metadata_attributes)))
+
+
+    def save(self,path):
+
+        '''Saves the store to a compressed NumPy .npz file. Load with fredpy.load_vintage_store().
 
         Args:
-            N (int): Number of periods to include in the data window.
+            path (string):  location of the file.
 
         Returns:
-            fredpy series
+            None
         '''
 
-        new_series = self.copy()
+        np.savez_compressed(path,
+                            date=self.date,
+                            realtime_end=self.realtime_end,
+                            realtime_start=self.realtime_start,
+                            value=self.value,
+                            metadata=np.array(json.dumps(self.metadata)))
 
-        new_series.data  =new_series.data.iloc[-N:]
-        new_series.date_range = 'Range: '+str(new_series.data.index[0])[:10]+' to '+str(new_series.data.index[-1])[:10]
 
-        return new_series
+    def update(self,new_series,observation_date=None):
 
-    
-    def recessions(self,color='0.5',alpha = 0.5):
-        
-        '''Creates recession bars for plots. Should be used after a plot has been made but
-            before either (1) a new plot is created or (2) a show command is issued.
+        '''Adds a new vintage of the series to the store. Real-time periods of values that are 
+        unchanged in the new vintage are extended; revised, new, and discontinued values open or 
+        close periods.
 
         Args:
-            color (string): Color of the bars. Default: '0.5'
-            alpha (float):  Transparency of the recession bars. Must be between 0 and 1
-                            Default: 0.5
+            new_series (fredpy series): the series as observed on observation_date, e.g., 
+                                            fredpy.series(series_id).
+            observation_date (string):  YYYY-MM-DD formatted date string. Vintage date of 
+                                            new_series. Must be later than the vintages in the store.
+                                            Default: new_series.observation_date.
 
         Returns:
+            None
         '''
 
-        series_peaks = []
-        series_troughs = []
-
-        date_begin = self.data.index[0]
-        date_end = self.data.index[-1]
+        if observation_date is None:
+            observation_date = datetime.datetime.strptime(new_series.observation_date,'%B %d, %Y').strftime('%Y-%m-%d')
 
-        for k in range(len(cycle_data)):
-            
-            if cycle_data['peaks'].loc[k]<date_begin and date_begin < cycle_data['troughs'].loc[k]:
-                series_peaks.append(date_begin)
-                series_troughs.append(cycle_data['troughs'].loc[k])
-            
-                
-            elif date_begin < cycle_data['peaks'].loc[k] and date_end > cycle_data['troughs'].loc[k]:
-                series_peaks.append(cycle_data['peaks'].loc[k])
-                series_troughs.append(cycle_data['troughs'].loc[k])
-                
-            elif cycle_data['peaks'].loc[k]<date_end and cycle_data['troughs'].loc[k] > date_end:
-                series_peaks.append(cycle_data['peaks'].loc[k])
-                series_troughs.append(date_end)
+        vintage = np.datetime64(_observation_date(observation_date),'D')
+        open_end = np.datetime64('9999-12-31','D')
 
-        for k in range(len(series_peaks)):
-            plt.axvspan(series_peaks[k], series_troughs[k], edgecolor= color, facecolor=color, alpha=alpha)
+        if len(self.realtime_start)>0 and vintage<=self.realtime_start.max():
+            raise ValueError('observation_date must be later than the vintages in the store.')
 
-    
-    def times(self,object2):
+        dates = new_series.data.index.values.astype('datetime64[D]')
+        values = new_series.data.to_numpy(dtype=float)
 
-        '''Multiplies the data from the current fredpy series with the data from object2.
+        # Periods that were current on the previous vintage and the values that are unchanged
+        current = np.flatnonzero(self.realtime_end>=vintage)
+        common, old, new = np.intersect1d(self.date[current],dates,assume_unique=True,return_indices=True)
+        same = (self.value[current][old]==values[new]) | (np.isnan(self.value[current][old]) & np.isnan(values[new]))
 
-        Args:
-            object2 (int, float, numpy ndarray, or similar or fredpy series)
+        realtime_end = self.realtime_end.copy()
+        realtime_end[current] = vintage-1
+        realtime_end[current[old[same]]] = open_end
 
-        Note:
-            You are responsibile for making sure that adding the series makes sense.
+        added = np.ones(len(dates),dtype=bool)
+        added[new[same]] = False
 
-        Returns:
-            fredpy series
-        '''
+        date = np.concatenate([self.date,dates[added]])
+        realtime_start = np.concatenate([self.realtime_start,np.full(added.sum(),vintage)])
+        realtime_end = np.concatenate([realtime_end,np.full(added.sum(),open_end)])
+        value = np.concatenate([self.value,values[added]])
 
-        return times(self,object2)
+        order = np.lexsort((realtime_start,date))
 
+        self.date = date[order]
+        self.realtime_end = realtime_end[order]
+        self.realtime_start = realtime_start[order]
+        self.value = value[order]
 
-    def window(self,start_end):
+        self.metadata = {name:getattr(new_series,name) for name in _metadata_attributes}
 
-        '''Restricts the data to a specified date window.
 
-        Args:
+    def vintage_dates(self):
 
-            start_end (list):   is an ordered pair: start_end = [start, end]
+        '''Returns the vintage dates on which the data in the store changed.
 
-                                    start is the date of the minimum date
-                                    end is the date of the maximum date
-        
-                                both are strings in either 'yyyy-mm-dd' or 'mm-dd-yyyy' format
+        Args:
 
         Returns:
-            fredpy series
+            list
         '''
 
-        new_series = self.copy()
-
-        new_series.data = new_series.data.loc[start_end[0]:start_end[1]]
-
-        if len(new_series.data)>0:
-            new_series.date_range = 'Range: '+str(new_series.data.index[0])[:10]+' to '+str(new_series.data.index[-1])[:10]
-        else:
-            new_series.date_range = 'Range: Null'
-
+        return [str(date) for date in np.unique(self.realtime_start)]
 
-        return new_series
 
 ######################################################################################################
 # Additional functions
 
-def divide(object1,object2):
+def divide(object1,object2,join=None,fill_value=None):
 
     '''Divides the data from the object1 by the data from object2.
 
     Args:
         object1 (int, float, numpy ndarray, or similar or fredpy series)
         object2 (int, float, numpy ndarray, or similar or fredpy series)
+        join (string):          If None (default), the dates of two series must be equal. Otherwise,
+                                    the dates are aligned: 'inner' (dates of both series), 'outer'
+                                    (dates of either series), 'left', or 'right'.
+        fill_value (float):     value of a series on aligned dates on which it has no observation.
+                                    Default: NaN
 
     Note:
         You are responsibile for making sure that adding the series makes sense.
@@ -856,73 +3613,35 @@ def divide(object1,object2):
         fredpy series
     '''
 
-    if not isinstance(object1, series) and not isinstance(object2, series):
-
-        return object1/object2
-
-    elif not isinstance(object1, series) and isinstance(object2, series):
-
-        new_series = object2.copy()
-        new_series.data = object1/new_series.data
-
-        return new_series
-
-    elif not isinstance(object2, series) and isinstance(object1, series):
-
-        new_series = object1.copy()
-        new_series.data = new_series.data/object2
-
-        return new_series
-
-    else:
-
-        if not object1.data.index.equals(object2.data.index):
+    return _arithmetic(object1,object2,'divide',join,fill_value)
 
-            raise ValueError('object1 and object2 do not have the same observation dates')
 
-        else:
 
-            new_series = series()
 
-            new_series.title = object1.title +' divided by '+object2.title
-            if object1.source == object2.source:
-                new_series.source = object1.source
-            else:
-                new_series.source = object1.source +' and '+object2.source
-            new_series.frequency = object1.frequency
-            new_series.frequency_short = object1.frequency_short
-            new_series.units = object1.units +' / '+object2.units
-            new_series.units_short = object1.units_short +' / '+object2.units_short
-            new_series.t = object1.t
-            new_series.date_range = object1.date_range
-
-            if object1.seasonal_adjustment == object2.seasonal_adjustment:
-                new_series.seasonal_adjustment = object1.seasonal_adjustment
-                new_series.seasonal_adjustment_short = object1.seasonal_adjustment_short
-            else:
-                new_series.seasonal_adjustment = object1.seasonal_adjustment +' and '+object2.seasonal_adjustment
-                new_series.seasonal_adjustment_short = object1.seasonal_adjustment_short +' and '+object2.seasonal_adjustment_short
+def fetch_many(series_ids,observation_date=None,max_workers=8,lazy=False):
 
-            if object1.last_updated == object2.last_updated:
-                new_series.last_updated = object1.last_updated
-            else:
-                new_series.last_updated = object1.last_updated +' and '+object2.last_updated
+    '''Downloads several series from FRED concurrently. The queries for each series are sent from a
+    pool of threads and are subject to fredpy.limiter.
 
-            if object1.release == object2.release:
-                new_series.release = object1.release
-            else:
-                new_series.release = object1.release +' and '+object2.release
-                
-            new_series.series_id = object1.series_id +' and '+object2.series_id
-            new_series.data  = object1.data/object2.data
+    Args:
+        series_ids (list):          unique FRED series IDs.
+        observation_date (string):  YYYY-MM-DD formatted date string. Vintage date at which all of the
+                                        series are observed. Default: today.
+        max_workers (int):          maximum number of series downloaded at the same time. Default: 8
+        lazy (bool):                If True, only the descriptive attributes of the series are
+                                        downloaded. See series. Default: False
 
-            return new_series
+    Returns:
+        dict of fredpy series with series IDs as keys
+    '''
 
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {series_id:executor.submit(series,series_id,observation_date,lazy) for series_id in series_ids}
 
+    return {series_id:future.result() for series_id,future in futures.items()}
 
     
-    
-def fred_api_request(api_key,path,parameters):
+def fred_api_request(api_key,path,parameters,stream=False):
     
     '''Queries the FRED API. Returns a requests.models.Response object if successful, otherwise will
     raise an error with a message that is hopefully helpful. Reference for API querries: 
@@ -932,28 +3651,35 @@ def fred_api_request(api_key,path,parameters):
         Args:
             api_key (string):   32-character alpha-numeric string.
             path (string):      API path.  List of available paths here: 
+            stream (bool):      If True, the body of the response is not read until it is accessed,
+                                    e.g. with Response.iter_content(). Default: False
 
         Returns:
             requests.models.Response
 
         Attributes:
             None
+
+    Note:
+        If fredpy.cache is assigned a request_cache instance, stored responses are returned without
+        querying the API and successful responses are stored unless stream is True.
     '''
     
-    
+    if cache is not None:
+        r = cache.get(path,parameters)
+        if r is not None:
+            return r
 
     status_code = None
     request_count = 0
 
     while request_count <= 10:
 
-        request_url = 'https://api.stlouisfed.org/'+path+'?'+'api_key='+str(api_key)+'&'
-
-        for key in parameters.keys():
-            request_url+=key+'='+str(parameters[key])+'&'
+        query = {'api_key':str(api_key)}
+        query.update(parameters)
             
-
-        r = requests.get(request_url)
+        time.sleep(_throttle())
+        r = client.get(path,query,stream=stream)
 
         status_code = r.status_code
 
@@ -961,12 +3687,16 @@ def fred_api_request(api_key,path,parameters):
             break
 
         elif status_code == 429:
-            print('FRED API error: API limit exceeded in API query (status code: '+str(status_code)+'). Retry in '+str(5+request_count)+' seconds.')
-            time.sleep(5+request_count)
+            r.close()
+            delay = _retry_delay(request_count)
+            logger.warning('FRED API error: API limit exceeded in API query (status code: %d). Retry in %.1f seconds.',status_code,delay)
+            time.sleep(delay)
 
         elif status_code == 504:
-            print('FRED API error: Gateway Time-out< in API query (status code: '+str(status_code)+'). Retry in '+str(5+request_count)+' seconds.')
-            time.sleep(5+request_count)
+            r.close()
+            delay = _retry_delay(request_count)
+            logger.warning('FRED API error: Gateway Time-out in API query (status code: %d). Retry in %.1f seconds.',status_code,delay)
+            time.sleep(delay)
 
 
         else:
@@ -978,6 +3708,9 @@ def fred_api_request(api_key,path,parameters):
 
         raise Exception('Unknown FRED API error. Status code: ',status_code)
 
+    if cache is not None and not stream:
+        cache.put(path,parameters,r.content)
+
     return r
 
 
@@ -991,98 +3724,76 @@ def get_vintage_dates(series_id):
     Returns:
         list'''
 
-    request_url = 'https://api.stlouisfed.org/fred/series/vintagedates?series_id=GDPDEF&api_key='+api_key+'&file_type=json'
-    r = requests.get(request_url)
+    path = 'fred/series/vintagedates'
+
+    parameters = {'series_id':series_id,
+      'file_type':'json'
+     }
+
+    r = fred_api_request(api_key=api_key,path=path,parameters=parameters)
     results = r.json()
 
     return results['vintage_dates']
 
 
-def minus(object1,object2):
+def load_vintage_store(path):
 
-    '''Subtracts the data from object2 from the data from object1.
+    '''Loads a vintage_store saved with vintage_store.save().
 
     Args:
-        object1 (int, float, numpy ndarray, or similar or fredpy series)
-        object2 (int, float, numpy ndarray, or similar or fredpy series)
-
-    Note:
-        You are responsibile for making sure that adding the series makes sense.
+        path (string):  location of the .npz file.
 
     Returns:
-        fredpy series
+        fredpy vintage_store
     '''
 
-    if not isinstance(object1, series) and not isinstance(object2, series):
-
-        return object1-object2
-
-    elif not isinstance(object1, series) and isinstance(object2, series):
-
-        new_series = object2.copy()
-        new_series.data = object1-new_series.data
-
-        return new_series
-
-    elif not isinstance(object2, series) and isinstance(object1, series):
-
-        new_series = object1.copy()
-        new_series.data = new_series.data-object2
+    store = vintage_store()
 
-        return new_series
-
-    else:
+    with np.load(path) as arrays:
+        store.date = arrays['date']
+        store.realtime_end = arrays['realtime_end']
+        store.realtime_start = arrays['realtime_start']
+        store.value = arrays['value']
+        store.metadata = json.loads(str(arrays['metadata']))
 
-        if not object1.data.index.equals(object2.data.index):
+    return store
 
-            raise ValueError('object1 and object2 do not have the same observation dates')
 
-        else:
+def minus(object1,object2,join=None,fill_value=None):
 
-            new_series = series()
+    '''Subtracts the data from object2 from the data from object1.
 
-            new_series.title = object1.title +' minus '+object2.title
-            if object1.source == object2.source:
-                new_series.source = object1.source
-            else:
-                new_series.source = object1.source +' and '+object2.source
-            new_series.frequency = object1.frequency
-            new_series.frequency_short = object1.frequency_short
-            new_series.units = object1.units +' - '+object2.units
-            new_series.units_short = object1.units_short +' - '+object2.units_short
-            new_series.t = object1.t
-            new_series.date_range = object1.date_range
-
-            if object1.seasonal_adjustment == object2.seasonal_adjustment:
-                new_series.seasonal_adjustment = object1.seasonal_adjustment
-                new_series.seasonal_adjustment_short = object1.seasonal_adjustment_short
-            else:
-                new_series.seasonal_adjustment = object1.seasonal_adjustment +' and '+object2.seasonal_adjustment
-                new_series.seasonal_adjustment_short = object1.seasonal_adjustment_short +' and '+object2.seasonal_adjustment_short
+    Args:
+        object1 (int, float, numpy ndarray, or similar or fredpy series)
+        object2 (int, float, numpy ndarray, or similar or fredpy series)
+        join (string):          If None (default), the dates of two series must be equal. Otherwise,
+                                    the dates are aligned: 'inner' (dates of both series), 'outer'
+                                    (dates of either series), 'left', or 'right'.
+        fill_value (float):     value of a series on aligned dates on which it has no observation.
+                                    Default: NaN
 
-            if object1.last_updated == object2.last_updated:
-                new_series.last_updated = object1.last_updated
-            else:
-                new_series.last_updated = object1.last_updated +' and '+object2.last_updated
+    Note:
+        You are responsibile for making sure that adding the series makes sense.
 
-            if object1.release == object2.release:
-                new_series.release = object1.release
-            else:
-                new_series.release = object1.release +' and '+object2.release
-                
-            new_series.series_id = object1.series_id +' and '+object2.series_id
-            new_series.data  = object1.data-object2.data
+    Returns:
+        fredpy series
+    '''
 
-            return new_series
+    return _arithmetic(object1,object2,'minus',join,fill_value)
 
 
-def plus(object1,object2):
+def plus(object1,object2,join=None,fill_value=None):
 
     '''Adds the data from object1 to the data from object2.
 
     Args:
         object1 (int, float, numpy ndarray, or similar or fredpy series)
         object2 (int, float, numpy ndarray, or similar or fredpy series)
+        join (string):          If None (default), the dates of two series must be equal. Otherwise,
+                                    the dates are aligned: 'inner' (dates of both series), 'outer'
+                                    (dates of either series), 'left', or 'right'.
+        fill_value (float):     value of a series on aligned dates on which it has no observation.
+                                    Default: NaN
 
     Note:
         You are responsibile for making sure that adding the series makes sense.
@@ -1091,67 +3802,68 @@ def plus(object1,object2):
         fredpy series
     '''
 
-    if not isinstance(object1, series) and not isinstance(object2, series):
+    return _arithmetic(object1,object2,'plus',join,fill_value)
 
-        return object1+object2
+def read_feather(path,columns=None,memory_map=True):
 
-    elif not isinstance(object1, series) and isinstance(object2, series):
+    '''Loads series saved with fredpy.write_feather() or series.to_feather(). Requires the pyarrow
+    package.
 
-        new_series = object2.copy()
-        new_series.data = new_series.data+object1
+    Args:
+        path (string):              location of the file.
+        columns (string or list):   name of a series in the file or a list of names. Default: all
+                                        of the series in the file.
+        memory_map (bool):          If True, the file is memory-mapped instead of read. The data of
+                                        series observed on all of the dates in the file are then
+                                        read-only views of the mapping that are read from disk when
+                                        used and are shared by all processes that map the file. 
+                                        Copy the data before modifying them in place. Default: True
 
-        return new_series
+    Returns:
+        fredpy series if columns is a string or if the file contains one series and columns is 
+            None, otherwise dict of fredpy series with names as keys
+    '''
 
-    elif not isinstance(object2, series) and isinstance(object1, series):
+    import pyarrow.feather as feather
 
-        new_series = object1.copy()
-        new_series.data = new_series.data+object2
+    names = columns
 
-        return new_series
+    if type(columns) == str:
+        names = [columns]
 
-    else:
+    if names is not None:
+        names = ['date']+list(names)
 
-        if not object1.data.index.equals(object2.data.index):
+    return _table_series(feather.read_table(path,columns=names,memory_map=memory_map),columns)
 
-            raise ValueError('object1 and object2 do not have the same observation dates')
 
-        else:
+def read_parquet(path,columns=None):
 
-            new_series = series()
+    '''Loads series saved with fredpy.write_parquet() or series.to_parquet(). Only the requested
+    columns are read from the file. Requires the pyarrow package.
 
-            new_series.title = object1.title +' plus '+object2.title
-            if object1.source == object2.source:
-                new_series.source = object1.source
-            else:
-                new_series.source = object1.source +' and '+object2.source
-            new_series.frequency = object1.frequency
-            new_series.frequency_short = object1.frequency_short
-            new_series.units = object1.units +' + '+object2.units
-            new_series.units_short = object1.units_short +' + '+object2.units_short
-            new_series.t = object1.t
-            new_series.date_range = object1.date_range
-
-            if object1.seasonal_adjustment == object2.seasonal_adjustment:
-                new_series.seasonal_adjustment = object1.seasonal_adjustment
-                new_series.seasonal_adjustment_short = object1.seasonal_adjustment_short
-            else:
-                new_series.seasonal_adjustment = object1.seasonal_adjustment +' and '+object2.seasonal_adjustment
-                new_series.seasonal_adjustment_short = object1.seasonal_adjustment_short +' and '+object2.seasonal_adjustment_short
+    Args:
+        path (string):              location of the file.
+        columns (string or list):   name of a series in the file or a list of names. Default: all
+                                        of the series in the file.
 
-            if object1.last_updated == object2.last_updated:
-                new_series.last_updated = object1.last_updated
-            else:
-                new_series.last_updated = object1.last_updated +' and '+object2.last_updated
+    Returns:
+        fredpy series if columns is a string or if the file contains one series and columns is 
+            None, otherwise dict of fredpy series with names as keys
+    '''
 
-            if object1.release == object2.release:
-                new_series.release = object1.release
-            else:
-                new_series.release = object1.release +' and '+object2.release
-                
-            new_series.series_id = object1.series_id +' and '+object2.series_id
-            new_series.data  = object1.data+object2.data
+    import pyarrow.parquet as pq
+
+    names = columns
+
+    if type(columns) == str:
+        names = [columns]
+
+    if names is not None:
+        names = ['date']+list(names)
+
+    return _table_series(pq.read_table(path,columns=names),columns)
 
-            return new_series
 
 def recessions(color='0.5',alpha = 0.5):
         
@@ -1166,86 +3878,58 @@ def recessions(color='0.5',alpha = 0.5):
     Returns:
     '''
 
+    import matplotlib.pyplot as plt
+
+    cycle_data = _get_cycle_data()
+
     for k in range(len(cycle_data['peaks'])):
         plt.axvspan(cycle_data['peaks'][k], cycle_data['troughs'][k], edgecolor= color, facecolor=color, alpha=alpha)
 
-def times(object1,object2):
+def refresh_cycle_data(url=None):
 
-    '''Multiplies the data from object1 with the data from object2.
+    '''Downloads the latest business cycle peak and trough dates and assigns them to 
+    fredpy.cycle_data.
 
     Args:
-        object1 (int, float, numpy ndarray, or similar or fredpy series)
-        object2 (int, float, numpy ndarray, or similar or fredpy series)
-
-
-    Note:
-        You are responsibile for making sure that multipying the series makes sense.
+        url (string):   location of a CSV file with columns 'peaks' and 'troughs'. Default:
+                            fredpy.cycle_data_url
 
     Returns:
-        fredpy series
+        Pandas DataFrame
     '''
 
-    if not isinstance(object1, series) and not isinstance(object2, series):
-
-        return object1*object2
-
-    elif not isinstance(object1, series) and isinstance(object2, series):
-
-        new_series = object2.copy()
-        new_series.data = new_series.data*object1
-
-        return new_series
-
-    elif not isinstance(object2, series) and isinstance(object1, series):
+    global cycle_data
 
-        new_series = object1.copy()
-        new_series.data = new_series.data*object2
+    if url is None:
+        url = cycle_data_url
 
-        return new_series
+    cycle_data = _read_cycle_data(url)
 
-    else:
+    return cycle_data
 
-        if not object1.data.index.equals(object2.data.index):
 
-            raise ValueError('object1 and object2 do not have the same observation dates')
+def times(object1,object2,join=None,fill_value=None):
 
-        else:
+    '''Multiplies the data from object1 with the data from object2.
 
-            new_series = series()
+    Args:
+        object1 (int, float, numpy ndarray, or similar or fredpy series)
+        object2 (int, float, numpy ndarray, or similar or fredpy series)
+        join (string):          If None (default), the dates of two series must be equal. Otherwise,
+                                    the dates are aligned: 'inner' (dates of both series), 'outer'
+                                    (dates of either series), 'left', or 'right'.
+        fill_value (float):     value of a series on aligned dates on which it has no observation.
+                                    Default: NaN
 
-            new_series.title = object1.title +' times '+object2.title
-            if object1.source == object2.source:
-                new_series.source = object1.source
-            else:
-                new_series.source = object1.source +' and '+object2.source
-            new_series.frequency = object1.frequency
-            new_series.frequency_short = object1.frequency_short
-            new_series.units = object1.units +' * '+object2.units
-            new_series.units_short = object1.units_short +' * '+object2.units_short
-            new_series.t = object1.t
-            new_series.date_range = object1.date_range
-
-            if object1.seasonal_adjustment == object2.seasonal_adjustment:
-                new_series.seasonal_adjustment = object1.seasonal_adjustment
-                new_series.seasonal_adjustment_short = object1.seasonal_adjustment_short
-            else:
-                new_series.seasonal_adjustment = object1.seasonal_adjustment +' and '+object2.seasonal_adjustment
-                new_series.seasonal_adjustment_short = object1.seasonal_adjustment_short +' and '+object2.seasonal_adjustment_short
 
-            if object1.last_updated == object2.last_updated:
-                new_series.last_updated = object1.last_updated
-            else:
-                new_series.last_updated = object1.last_updated +' and '+object2.last_updated
+    Note:
+        You are responsibile for making sure that multipying the series makes sense.
 
-            if object1.release == object2.release:
-                new_series.release = object1.release
-            else:
-                new_series.release = object1.release +' and '+object2.release
-                
-            new_series.series_id = object1.series_id +' and '+object2.series_id
-            new_series.data  = object1.data*object2.data
+    Returns:
+        fredpy series
+    '''
 
-            return new_series
+    return _arithmetic(object1,object2,'times',join,fill_value)
 
 
 def to_fred_series(data,dates,frequency='',frequency_short='',last_updated='',notes='',release='',seasonal_adjustment='',seasonal_adjustment_short='',series_id='',source='',t=0,title='',units='',units_short=''):
@@ -1326,29 +4010,141 @@ def to_fred_series(data,dates,frequency='',frequency_short='',last_updated='',no
     f.date_range = 'Range: '+str(f.data.index[0])[:10]+' to '+str(f.data.index[-1])[:10]
     return f
 
-def window_equalize(series_list):
+def vintage_panel(series_id,start=None,end=None,long=False):
+
+    '''Downloads all vintages of a series from ALFRED with one query (or one query per 100,000 
+    real-time periods). By default, returns a matrix with one row for each vintage date on which
+    the data changed and one column for each observation date. Row v contains the data as observed
+    on vintage date v and NaN for observations not yet released.
+
+    Args:
+        series_id (string): unique FRED series ID.
+        start (string):     YYYY-MM-DD formatted date string. First vintage date. Default: 
+                                '1776-07-04', the earliest date in ALFRED.
+        end (string):       YYYY-MM-DD formatted date string. Last vintage date. Default: 
+                                '9999-12-31', i.e., including the latest vintage.
+        long (bool):        If True, returns the real-time periods instead: a table with columns
+                                'realtime_start', 'realtime_end', 'date', and 'value' in which each
+                                row gives the value of an observation from realtime_start through
+                                realtime_end. Default: False
+
+    Returns:
+        Pandas DataFrame
+    '''
+
+    if start is None:
+        start = '1776-07-04'
+
+    if end is None:
+        end = '9999-12-31'
+
+    parameters = {'series_id':series_id,
+      'realtime_start':start,
+      'realtime_end':end,
+      'file_type':'json'
+     }
 
-    '''Adjusts the date windows for a collection of fredpy.series objects to the 
-    smallest common date window.
+    arrays = _download_observations(parameters,realtime=True)
+
+    if long:
+        return pd.DataFrame({'realtime_start':arrays['realtime_start'],
+                             'realtime_end':arrays['realtime_end'],
+                             'date':arrays['date'].astype('datetime64[ns]'),
+                             'value':arrays['value']})
+
+    return _vintage_matrix(arrays)
+
+
+def window_equalize(series_list,dense=False):
+
+    '''Adjusts the date windows for a collection of fredpy.series objects to the
+    smallest common date window. The common window is found from the first and last dates of all
+    of the series at once, and the data of the new series are positional slices of the data of the
+    original series, not copies.
 
     Args:
         series_list (list): A list of fredpy.series objects
+        dense (bool):       If True, the data in the common window are returned as one 2-D array
+                                with a column for each series instead of as a list of series. Series
+                                with different dates are aligned on the union of their dates with
+                                NaN for missing observations. Default: False
 
     Returns:
-        list
+        list, or numpy ndarray and pandas DatetimeIndex if dense is True
     '''
 
-    minimums = []
-    maximums = []
-    for s in series_list:
-        minimums.append(s.data.index[0])
-        maximums.append(s.data.index[-1])
+    dates_list = [s.data.index.values for s in series_list]
+
+    if len(dates_list)>0 and all(len(dates)>0 for dates in dates_list):
+        bounds = np.array([(dates[0],dates[-1]) for dates in dates_list])
+        start, end = bounds[:,0].max(), bounds[:,1].min()
+        positions = [(dates.searchsorted(start.astype(dates.dtype)),dates.searchsorted(end.astype(dates.dtype),side='right')) if dates.dtype==bounds.dtype
+                     else (s.data.index.searchsorted(start),s.data.index.searchsorted(end,side='right')) for s, dates in zip(series_list,dates_list)]
+    else:
+        positions = [(0,0) for dates in dates_list]
 
-    start_end = [np.max(minimums),np.min(maximums)]
+    if dense:
+        return _aligned_values([s.data.to_numpy(dtype=float)[first:last] for s, (first,last) in zip(series_list,positions)],
+                               [dates[first:last] for dates, (first,last) in zip(dates_list,positions)])
 
     new_list = []
-    for s in series_list:
+    for s, dates, (first,last) in zip(series_list,dates_list,positions):
+
+        new_series = s.copy()
 
-        new_list.append(s.window(start_end))
+        if first>0 or last<len(dates):
+            new_series.data = s.data.iloc[first:last]
+
+        if last>first:
+            new_series.date_range = 'Range: '+str(dates[first])[:10]+' to '+str(dates[last-1])[:10]
+        else:
+            new_series.date_range = 'Range: Null'
+
+        new_list.append(new_series)
 
     return new_list
+
+
+def write_feather(series_list,path,compression='uncompressed'):
+
+    '''Saves a collection of series to one Feather (Arrow IPC) file with the same layout as
+    fredpy.write_parquet(). Uncompressed files can be memory-mapped by fredpy.read_feather(). 
+    Requires the pyarrow package.
+
+    Args:
+        series_list (list or dict): fredpy series. If a dict, the keys are used as the names of the
+                                        columns, otherwise the series IDs are used.
+        path (string):              location of the file.
+        compression (string):       'uncompressed', 'lz4', or 'zstd'. Compressed files are smaller
+                                        but must be decompressed into memory when read. Default:
+                                        'uncompressed'
+
+    Returns:
+        None
+    '''
+
+    import pyarrow.feather as feather
+
+    feather.write_feather(_series_table(series_list),path,compression=compression)
+
+
+def write_parquet(series_list,path,compression='snappy'):
+
+    '''Saves a collection of series to one Parquet file with a column for the dates and a column
+    for each series. Dates on which a series has no observation are stored as null values and the 
+    attributes of the series are stored in the metadata of the file. Load with 
+    fredpy.read_parquet(). Requires the pyarrow package.
+
+    Args:
+        series_list (list or dict): fredpy series. If a dict, the keys are used as the names of the
+                                        columns, otherwise the series IDs are used.
+        path (string):              location of the file.
+        compression (string):       compression codec. Default: 'snappy'
+
+    Returns:
+        None
+    '''
+
+    import pyarrow.parquet as pq
+
+    pq.write_table(_series_table(series_list),path,compression=compression)
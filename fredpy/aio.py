@@ -0,0 +1,207 @@
+'''asyncio interface for downloading data from FRED. Requires the aiohttp package:
+
+    pip install aiohttp
+
+Example:
+
+    import asyncio
+    import fredpy.aio
+
+    gdp = asyncio.run(fredpy.aio.series_async('GDP'))
+'''
+
+import asyncio
+import fredpy
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+
+def _session(max_connections):
+
+    # Returns a session that pools up to max_connections keep-alive connections to the API. Uses
+    # the timeout of fredpy.client.
+
+    if aiohttp is None:
+        raise ImportError('fredpy.aio requires the aiohttp package. Install with: pip install aiohttp')
+
+    return aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=max_connections),
+                                 timeout=aiohttp.ClientTimeout(total=fredpy.client.timeout))
+
+
+async def _blocking(function,*args):
+
+    # Runs function(*args), which may block, e.g., on the SQLite database of fredpy.cache or the
+    # lock of fredpy.limiter, in the default executor so that other coroutines keep running.
+
+    return await asyncio.get_running_loop().run_in_executor(None,function,*args)
+
+
+async def _download_observations_async(session,api_key,parameters):
+
+    # Returns the results of a fred/series/observations query, downloading results longer than
+    # fredpy._observation_limit in pages like fredpy._download_observations.
+
+    path = 'fred/series/observations'
+    limit = fredpy._observation_limit
+
+    parameters = dict(parameters,limit=limit,offset=0)
+
+    results = await fred_api_request_async(session,api_key,path,parameters)
+
+    pages = await asyncio.gather(*[fred_api_request_async(session,api_key,path,dict(parameters,offset=offset))
+                                   for offset in range(limit,results['count'],limit)])
+
+    for page in pages:
+        results['observations'].extend(page['observations'])
+
+    return results
+
+
+async def fetch_many_async(series_ids,observation_date=None,max_connections=8,session=None):
+
+    '''Downloads several series from FRED concurrently. Queries are subject to fredpy.limiter.
+
+    Args:
+        series_ids (list):                  unique FRED series IDs.
+        observation_date (string):          YYYY-MM-DD formatted date string. Vintage date at which all
+                                                of the series are observed. Default: today.
+        max_connections (int):              maximum number of simultaneous connections to the API.
+                                                Ignored if session is provided. Default: 8
+        session (aiohttp.ClientSession):    session used for the queries. Default: a new session that
+                                                is closed on return.
+
+    Returns:
+        dict of fredpy series with series IDs as keys
+    '''
+
+    if session is None:
+        async with _session(max_connections) as session:
+            return await fetch_many_async(series_ids,observation_date,session=session)
+
+    results = await asyncio.gather(*[series_async(series_id,observation_date,session=session) for series_id in series_ids])
+
+    return dict(zip(series_ids,results))
+
+
+async def fred_api_request_async(session,api_key,path,parameters):
+
+    '''Queries the FRED API at fredpy.client.base_url without blocking the event loop. Retries after
+    status codes 429 (API limit exceeded) and 504 (gateway time-out) like fredpy.fred_api_request.
+    Reference for API queries:
+
+    https://fred.stlouisfed.org/docs/api/fred/
+
+    Args:
+        session (aiohttp.ClientSession):    session used for the query.
+        api_key (string):                   32-character alpha-numeric string.
+        path (string):                      API path.
+        parameters (dict):                  query parameters.
+
+    Returns:
+        dict containing the decoded JSON response
+    '''
+
+    cache = fredpy.cache
+
+    if cache is not None:
+        r = await _blocking(cache.get,path,parameters)
+        if r is not None:
+            return r.json()
+
+    query = {'api_key':str(api_key)}
+    query.update({key:str(value) for key,value in parameters.items()})
+
+    status_code = None
+    request_count = 0
+
+    while request_count <= 10:
+
+        await asyncio.sleep(await _blocking(fredpy._throttle))
+
+        async with session.get(fredpy.client.base_url+path,params=query) as r:
+
+            status_code = r.status
+
+            if status_code == 200:
+                content = await r.read()
+                break
+
+            elif status_code == 429:
+                delay = fredpy._retry_delay(request_count)
+                fredpy.logger.warning('FRED API error: API limit exceeded in API query (status code: %d). Retry in %.1f seconds.',status_code,delay)
+
+            elif status_code == 504:
+                delay = fredpy._retry_delay(request_count)
+                fredpy.logger.warning('FRED API error: Gateway Time-out in API query (status code: %d). Retry in %.1f seconds.',status_code,delay)
+
+            else:
+                r.raise_for_status()
+
+        await asyncio.sleep(delay)
+        request_count+=1
+
+    if request_count >10 and status_code != 200:
+
+        raise Exception('Unknown FRED API error. Status code: ',status_code)
+
+    if cache is not None:
+        await _blocking(cache.put,path,parameters,content)
+
+    return fredpy._loads(content)
+
+
+async def series_async(series_id,observation_date=None,session=None):
+
+    '''Downloads a series from FRED. The metadata, observations, and release are requested
+    concurrently, followed by the source of the release.
+
+    Args:
+        series_id (string):                 unique FRED series ID.
+        observation_date (string):          YYYY-MM-DD formatted date string. Vintage date at which the
+                                                series is observed. Default: today.
+        session (aiohttp.ClientSession):    session used for the queries. Default: a new session that
+                                                is closed on return.
+
+    Returns:
+        fredpy series
+    '''
+
+    if session is None:
+        async with _session(4) as session:
+            return await series_async(series_id,observation_date,session=session)
+
+    api_key = fredpy.api_key
+
+    if api_key is None:
+        raise ValueError('fredpy.api_key value not assigned. You need to provide your key for the FRED API.')
+
+    observation_date = fredpy._observation_date(observation_date)
+
+    parameters = {'series_id':series_id,
+      'realtime_start':observation_date,
+      'realtime_end':observation_date,
+      'file_type':'json'
+     }
+
+    metadata, observations, release = await asyncio.gather(
+        fred_api_request_async(session,api_key,'fred/series',parameters),
+        _download_observations_async(session,api_key,parameters),
+        fred_api_request_async(session,api_key,'fred/series/release',parameters))
+
+    parameters = {'series_id':series_id,
+      'release_id':release['releases'][0]['id'],
+      'file_type':'json'
+     }
+
+    sources = await fred_api_request_async(session,api_key,'fred/release/sources',parameters)
+
+    new_series = fredpy.series()
+    new_series._set_metadata(series_id,observation_date,metadata)
+    new_series._set_data(fredpy._observation_arrays(observations['observations']))
+    new_series.release = release['releases'][0]['name']
+    new_series.source = sources['sources'][0]['name']
+
+    return new_series
@@ -6,6 +6,7 @@ with open("README.md", "r") as fh:
 setuptools.setup(
   name = 'fredpy',
   packages = ['fredpy'],
+  package_data = {'fredpy':['business_cycle_dates.csv']},
   version = '3.2.2',
   description = 'A package for downloading and working with data from Federal Reserve Economic Data',
   author = 'Brian C. Jenkins',
@@ -0,0 +1,90 @@
+'''Checks that arithmetic with series with different dates aligns the dates like pandas.
+
+Usage:
+
+    python -m pytest tests
+'''
+
+import operator
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0,os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import fredpy
+
+
+functions = {'plus':operator.add,'minus':operator.sub,'times':operator.mul,'divide':operator.truediv}
+
+
+def monthly(start,n,step=1,seed=0):
+
+    # Returns a series with n observations every step months from start.
+
+    dates = np.arange(np.datetime64(start),np.datetime64(start)+step*n,step).astype('datetime64[D]').astype(str)
+    values = 1+np.random.default_rng(seed).random(n)
+
+    return fredpy.to_fred_series(values,dates,frequency='Monthly',series_id='S{}'.format(seed),title='Series {}'.format(seed),units='Index')
+
+
+pairs = {'same dates':(monthly('2000-01',24),monthly('2000-01',24,seed=1)),
+         'overlapping':(monthly('2000-01',24),monthly('2001-01',24,seed=1)),
+         'contained':(monthly('2000-01',48),monthly('2001-01',12,seed=1)),
+         'disjoint':(monthly('2000-01',12),monthly('2005-01',12,seed=1)),
+         'monthly and quarterly':(monthly('2000-01',36),monthly('2000-01',12,3,seed=1))}
+
+
+@pytest.mark.parametrize('operation',list(functions))
+@pytest.mark.parametrize('fill_value',[None,0.0,2.5])
+@pytest.mark.parametrize('join',['inner','outer','left','right'])
+@pytest.mark.parametrize('pair',list(pairs))
+def test_join_matches_pandas(pair,join,fill_value,operation):
+
+    s1, s2 = pairs[pair]
+
+    with np.errstate(divide='ignore'):
+        result = getattr(fredpy,operation)(s1,s2,join=join,fill_value=fill_value)
+
+        data1, data2 = s1.data.align(s2.data,join=join,fill_value=np.nan if fill_value is None else fill_value)
+        expected = functions[operation](data1,data2)
+
+    assert result.data.index.equals(expected.index)
+    assert np.allclose(result.data.to_numpy(),expected.to_numpy(),equal_nan=True)
+
+    if len(expected)>0:
+        assert result.date_range == 'Range: '+str(expected.index[0])[:10]+' to '+str(expected.index[-1])[:10]
+    else:
+        assert result.date_range == 'Range: Null'
+
+
+def test_dates_must_be_equal_without_join():
+
+    s1, s2 = pairs['overlapping']
+
+    with pytest.raises(ValueError):
+        fredpy.plus(s1,s2)
+
+    with pytest.raises(ValueError):
+        fredpy.plus(s1,s2,join='cross')
+
+    assert fredpy.plus(*pairs['same dates']).data.index.equals(s1.data.index)
+
+
+@pytest.mark.parametrize('join, fill_value',[('inner',None),('outer',None),('left',1.0),('right',0.0)])
+def test_operators_use_module_settings(monkeypatch,join,fill_value):
+
+    monkeypatch.setattr(fredpy,'arithmetic_join',join)
+    monkeypatch.setattr(fredpy,'arithmetic_fill_value',fill_value)
+
+    s1, s2 = pairs['overlapping']
+
+    for symbol, operation in [('+','plus'),('-','minus'),('*','times'),('/','divide')]:
+        for a, b in [(s1,s2),(s2,s1)]:
+            result = functions[operation](a,b)
+            expected = getattr(fredpy,operation)(a,b,join=join,fill_value=fill_value)
+
+            assert result.data.equals(expected.data)
+            assert result.title == expected.title
+            assert result.units == 'Index '+symbol+' Index'
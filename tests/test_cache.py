@@ -0,0 +1,97 @@
+'''Checks that fredpy.request_cache expires responses to queries for current data after ttl seconds
+and evicts the least recently used responses when the stored responses exceed max_size.
+
+Usage:
+
+    python -m pytest tests
+'''
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0,os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import fredpy
+
+
+path = 'fred/series/observations'
+
+
+@pytest.fixture
+def clock(monkeypatch):
+
+    # Replaces time.time with a clock that is advanced by setting clock[0].
+
+    now = [1.6e9]
+    monkeypatch.setattr(fredpy.time,'time',lambda: now[0])
+
+    return now
+
+
+def content(i,size=400):
+
+    # Returns size bytes that do not compress.
+
+    return np.random.default_rng(i).bytes(size)
+
+
+def test_get_returns_stored_response(tmp_path):
+
+    cache = fredpy.request_cache(str(tmp_path/'cache.sqlite'))
+    parameters = {'series_id':'GDP','file_type':'json','api_key':'a'}
+
+    assert cache.get(path,parameters) is None
+
+    cache.put(path,parameters,b'{"observations":[]}')
+
+    # The API key is not part of the key
+    r = cache.get(path,dict(parameters,api_key='b'))
+    assert r.status_code == 200
+    assert r.json() == {'observations':[]}
+    assert cache.get(path,dict(parameters,series_id='GNP')) is None
+
+    cache.clear()
+    assert cache.get(path,parameters) is None
+
+
+def test_responses_for_current_data_expire(tmp_path,clock):
+
+    cache = fredpy.request_cache(str(tmp_path/'cache.sqlite'),ttl=60)
+    current = {'series_id':'GDP'}
+    vintage = {'series_id':'GDP','realtime_start':'2000-01-01','realtime_end':'2000-01-01'}
+
+    cache.put(path,current,content(0))
+    cache.put(path,vintage,content(1))
+
+    clock[0]+=59
+    assert cache.get(path,current).content == content(0)
+
+    clock[0]+=2
+    assert cache.get(path,current) is None
+
+    # A response for a realtime_end date in the past never changes
+    clock[0]+=10**8
+    assert cache.get(path,vintage).content == content(1)
+
+
+def test_least_recently_used_responses_are_evicted(tmp_path,clock):
+
+    # Room for two responses of 400 bytes
+    cache = fredpy.request_cache(str(tmp_path/'cache.sqlite'),max_size=1000/1024**2)
+
+    for i in range(2):
+        clock[0]+=1
+        cache.put(path,{'series_id':str(i)},content(i))
+
+    # Reading response 0 makes response 1 the least recently used
+    clock[0]+=1
+    assert cache.get(path,{'series_id':'0'}) is not None
+
+    clock[0]+=1
+    cache.put(path,{'series_id':'2'},content(2))
+
+    assert cache.get(path,{'series_id':'0'}).content == content(0)
+    assert cache.get(path,{'series_id':'1'}) is None
+    assert cache.get(path,{'series_id':'2'}).content == content(2)
@@ -0,0 +1,136 @@
+'''Checks the HP, Baxter-King, and Christiano-Fitzgerald filters of series and panel against
+statsmodels and the one-sided HP filter against the two-sided filter of each prefix of the data.
+
+Usage:
+
+    python -m pytest tests
+'''
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0,os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import fredpy
+
+filters = pytest.importorskip('statsmodels.tsa.filters.api')
+
+
+def quarterly(n,seed):
+
+    # Returns a quarterly series with n observations of a random walk.
+
+    values = 100+np.random.default_rng(seed).standard_normal(n).cumsum()
+    dates = np.arange(np.datetime64('1947-01'),np.datetime64('1947-01')+3*n,3).astype('datetime64[D]').astype(str)
+
+    return fredpy.to_fred_series(values,dates,frequency='Quarterly',series_id='S{}'.format(seed),t=4)
+
+
+@pytest.mark.parametrize('lamb',[6.25,1600,129600])
+@pytest.mark.parametrize('n',[3,10,250])
+def test_hp_filter_matches_statsmodels(n,lamb):
+
+    s = quarterly(n,0)
+    cycle, trend = s.hp_filter(lamb=lamb)
+    expected_cycle, expected_trend = filters.hpfilter(s.data.to_numpy(),lamb=lamb)
+
+    assert np.allclose(cycle.data.to_numpy(),expected_cycle)
+    assert np.allclose(trend.data.to_numpy(),expected_trend)
+    assert trend.data.index.equals(s.data.index)
+
+
+def test_panel_hp_filter_matches_series():
+
+    # The series have different lengths, so the panel filters each range of rows separately
+    series_list = [quarterly(120,0),quarterly(120,1),quarterly(80,2)]
+    cycle, trend = fredpy.panel(series_list).hp_filter()
+
+    for s in series_list:
+        expected_cycle, expected_trend = filters.hpfilter(s.data.to_numpy(),lamb=1600)
+
+        assert np.allclose(trend[s.series_id].data.to_numpy(),expected_trend)
+        assert np.allclose(cycle[s.series_id].data.to_numpy(),expected_cycle)
+
+
+@pytest.mark.parametrize('lamb',[6.25,1600])
+def test_one_sided_hp_filter_is_last_value_of_two_sided(lamb):
+
+    s = quarterly(60,3)
+    cycle, trend = s.hp_filter(lamb=lamb,one_sided=True)
+    values = s.data.to_numpy()
+
+    expected = [values[0],values[1]]+[filters.hpfilter(values[:t+1],lamb=lamb)[1][-1] for t in range(2,len(values))]
+
+    assert np.allclose(trend.data.to_numpy(),expected)
+    assert np.allclose(cycle.data.to_numpy(),values-np.array(expected))
+
+
+def test_one_sided_hp_filter_continues_from_state():
+
+    s = quarterly(100,4)
+    values = s.data.to_numpy()
+
+    expected, state = fredpy._hp_one_sided(values,1600)
+    first, state = fredpy._hp_one_sided(values[:70],1600)
+    rest, state = fredpy._hp_one_sided(values[70:],1600,state)
+
+    assert np.allclose(np.concatenate([first,rest]),expected)
+
+    # The state kept with the series is used again for the same data and dropped with new data
+    s.hp_filter(one_sided=True)
+    assert s._filter_state['n'] == 100
+    assert np.allclose(s.hp_filter(one_sided=True)[1].data.to_numpy(),expected)
+
+    s.data = s.data.iloc[:70]
+    assert s._filter_state is None
+    assert np.allclose(s.hp_filter(one_sided=True)[1].data.to_numpy(),first)
+
+
+@pytest.mark.parametrize('low, high, K',[(6,32,12),(2,8,3),(3,8,1)])
+def test_bp_filter_matches_statsmodels(low,high,K):
+
+    s = quarterly(100,5)
+    cycle, trend = s.bp_filter(low=low,high=high,K=K)
+    expected = filters.bkfilter(s.data.to_numpy(),low=low,high=high,K=K)
+
+    assert np.allclose(cycle.data.to_numpy(),expected)
+    assert np.allclose(trend.data.to_numpy(),s.data.to_numpy()[K:-K]-expected)
+    assert cycle.data.index.equals(s.data.index[K:-K])
+
+
+@pytest.mark.parametrize('low, high',[(6,32),(2,8),(1.5,8)])
+@pytest.mark.parametrize('n',[2,3,101])
+def test_cf_filter_matches_statsmodels(n,low,high):
+
+    s = quarterly(n,6)
+
+    if low < 2:
+        with pytest.raises(ValueError):
+            s.cf_filter(low=low,high=high)
+        return
+
+    cycle, trend = s.cf_filter(low=low,high=high)
+    expected_cycle, expected_trend = filters.cffilter(s.data.to_numpy(),low=low,high=high,drift=False)
+
+    assert np.allclose(cycle.data.to_numpy(),expected_cycle)
+    assert np.allclose(trend.data.to_numpy(),expected_trend)
+
+
+def test_panel_bp_and_cf_filters_match_series():
+
+    series_list = [quarterly(120,7),quarterly(120,8),quarterly(90,9)]
+    p = fredpy.panel(series_list)
+
+    cycle, trend = p.cf_filter()
+
+    for s in series_list:
+        assert np.allclose(cycle[s.series_id].data.to_numpy(),s.cf_filter()[0].data.to_numpy())
+        assert np.allclose(trend[s.series_id].data.to_numpy(),s.cf_filter()[1].data.to_numpy())
+
+    cycle, trend = fredpy.panel(series_list[:2]).bp_filter()
+
+    for s in series_list[:2]:
+        assert np.allclose(cycle[s.series_id].data.to_numpy(),s.bp_filter()[0].data.to_numpy())
+        assert np.allclose(trend[s.series_id].data.to_numpy(),s.bp_filter()[1].data.to_numpy())
@@ -0,0 +1,71 @@
+'''Checks that chains of lazy_series transformations give the same results as the series methods.
+
+Usage:
+
+    python -m pytest tests
+'''
+
+import itertools
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0,os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import fredpy
+
+
+steps = [('log',()),
+         ('pc',()),
+         ('pc',(True,'forward',True)),
+         ('apc',()),
+         ('apc',(True,)),
+         ('ma',(4,)),
+         ('ma',(3,True)),
+         ('drop_nan',()),
+         ('window',(['1960-01-01','1990-12-01'],)),
+         ('recent',(40,))]
+
+
+def monthly(missing):
+
+    # Returns a positive monthly series with 600 observations and, if missing, some missing values.
+
+    values = 100+np.random.default_rng(0).standard_normal(600).cumsum()
+    dates = np.arange(np.datetime64('1947-01'),np.datetime64('1947-01')+600).astype('datetime64[D]').astype(str)
+
+    if missing:
+        values[5::37] = np.nan
+
+    return fredpy.to_fred_series(values,dates,frequency='Monthly',series_id='S',title='Series',units='Index')
+
+
+@pytest.mark.parametrize('missing',[False,True])
+@pytest.mark.parametrize('chain',list(itertools.product(steps,repeat=2))+list(itertools.product(steps,repeat=3)))
+def test_lazy_matches_series(chain,missing):
+
+    s = monthly(missing)
+
+    eager = s
+    lazy = s.lazy()
+
+    with np.errstate(all='ignore'):
+
+        try:
+            for name, arguments in chain:
+                eager = getattr(eager,name)(*arguments)
+        except IndexError:
+            pytest.skip('the series methods fail on an empty result')
+
+        result = lazy
+        for name, arguments in chain:
+            result = getattr(result,name)(*arguments)
+
+        result = result.collect()
+
+    assert np.allclose(result.data.to_numpy(),eager.data.to_numpy(),rtol=1e-10,atol=1e-10,equal_nan=True)
+    assert result.data.index.equals(eager.data.index)
+
+    for attribute in ['date_range','t','title','units','units_short']:
+        assert getattr(result,attribute) == getattr(eager,attribute)
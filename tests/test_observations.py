@@ -0,0 +1,78 @@
+'''Checks that observations parsed from a streamed response in chunks of any size are the same as
+observations parsed from the whole response.
+
+Usage:
+
+    python -m pytest tests
+'''
+
+import json
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0,os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import fredpy
+
+
+class response:
+
+    # Stands in for a streamed requests.Response with content that arrives in chunks of size bytes.
+
+    def __init__(self,content,size):
+
+        self.content = content
+        self.size = size
+
+    def iter_content(self,chunk_size=1):
+
+        for i in range(0,len(self.content),self.size):
+            yield self.content[i:i+self.size]
+
+
+def observations_json(n,realtime=False,count=True):
+
+    # Returns the text of a fred/series/observations response with n observations, some missing.
+
+    dates = np.arange(np.datetime64('1990-01-01'),np.datetime64('1990-01-01')+n).astype(str)
+    observations = []
+
+    for i, date in enumerate(dates):
+        observation = {'realtime_start':'2020-01-01','realtime_end':'9999-12-31','date':date,'value':'.' if i%7==3 else '{:.3f}'.format(i/3)}
+        if not realtime:
+            del observation['realtime_start'], observation['realtime_end']
+        observations.append(observation)
+
+    results = {'realtime_start':'2020-01-01','realtime_end':'2020-01-01','units':'lin','offset':0,'limit':100000}
+    if count:
+        results['count'] = n
+    results['observations'] = observations
+
+    return json.dumps(results,indent=1).encode()
+
+
+@pytest.mark.parametrize('realtime',[False,True])
+@pytest.mark.parametrize('count',[False,True])
+@pytest.mark.parametrize('size',[1,7,50,4096,10**7])
+@pytest.mark.parametrize('n',[0,1,3000])
+def test_streamed_observations_match(n,size,count,realtime):
+
+    content = observations_json(n,realtime,count)
+    expected = fredpy._observation_arrays(json.loads(content)['observations'],realtime)
+
+    arrays, total = fredpy._stream_observation_arrays(response(content,size),realtime)
+
+    assert total == n
+    assert sorted(arrays) == sorted(expected)
+
+    for field in expected:
+        assert arrays[field].dtype == expected[field].dtype
+        assert np.array_equal(arrays[field],expected[field],equal_nan=field=='value')
+
+
+def test_streamed_response_without_observations():
+
+    with pytest.raises(ValueError):
+        fredpy._stream_observation_arrays(response(b'{"error_code":400,"error_message":"Bad Request."}',10))
@@ -0,0 +1,81 @@
+'''Checks the waiting times given by fredpy.rate_limiter as its token bucket empties and refills.
+
+Usage:
+
+    python -m pytest tests
+'''
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0,os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import fredpy
+
+
+@pytest.fixture
+def clock(monkeypatch):
+
+    # Replaces time.time with a clock that is advanced by setting clock[0].
+
+    now = [1.6e9]
+    monkeypatch.setattr(fredpy.time,'time',lambda: now[0])
+
+    return now
+
+
+def limiters(tmp_path):
+
+    # Returns a limiter for the threads of this process and, with fcntl, two limiters that share a
+    # lock file like limiters in two processes.
+
+    yield [fredpy.rate_limiter(requests_per_minute=70,burst=10)]
+
+    if fredpy.fcntl is not None:
+        lock_file = str(tmp_path/'fredpy.lock')
+        yield [fredpy.rate_limiter(requests_per_minute=70,burst=10,lock_file=lock_file) for i in range(2)]
+
+
+def test_burst_must_be_less_than_rate():
+
+    with pytest.raises(ValueError):
+        fredpy.rate_limiter(requests_per_minute=10,burst=10)
+
+
+def test_bucket_empties_and_refills(tmp_path,clock):
+
+    # The bucket holds 10 tokens and gains one each second
+    for group in limiters(tmp_path):
+
+        waits = [group[i%len(group)].reserve() for i in range(12)]
+        assert np.allclose(waits,[0]*10+[1,2])
+
+        # The two queries in debt are sent after 2 seconds, so after 5 seconds 3 tokens are available
+        clock[0]+=5
+        assert np.allclose([group[i%len(group)].reserve() for i in range(4)],[0,0,0,1])
+
+        # The bucket holds no more than burst tokens
+        clock[0]+=1000
+        assert np.allclose([group[i%len(group)].reserve() for i in range(11)],[0]*10+[1])
+
+        clock[0]+=1000
+
+
+def test_no_more_than_requests_per_minute(clock):
+
+    limiter = fredpy.rate_limiter(requests_per_minute=120,burst=10)
+    start = clock[0]
+    sent = []
+
+    # Queries are sent as soon as the limiter allows, in bursts of 25 every 30 seconds
+    for i in range(400):
+        if i%25 == 0:
+            clock[0] = max(clock[0],start+30*(i//25))
+        sent.append(clock[0]+limiter.reserve())
+
+    sent = np.array(sent)
+    in_minute = np.searchsorted(sent,sent+60,side='left')-np.arange(len(sent))
+
+    assert in_minute.max() <= 120